@@ -2,13 +2,14 @@ import sys
 import os
 import json
 from datetime import datetime
+from operator import attrgetter
 sys.path.append('.')
 
 from src.pdf_extractor import extract_text, extract_text_with_line_numbers, extract_lines_range
 from src.transform.metadata_extractor import MetadataExtractor
 from src.transform.preamble_identifier import PreambleIdentifier
 from src.transform.recitals_identifier import RecitalsIdentifier
-from src.transform.recitals_builder import build_recitals_xml, get_recitals_summary
+from src.transform.recitals_builder import build_recitals_xml, get_recitals_summary, parse_recitals_text
 from src.transform.chapter_identifier import ChapterIdentifier
 from src.transform.chapter_builder import build_chapters_xml, get_chapters_summary, build_chapters_with_sections_xml
 from src.transform.section_identifier import SectionIdentifier
@@ -16,7 +17,7 @@ from src.transform.frbr_builder import build_frbr_metadata
 from src.transform.akn_builder import create_akoma_ntoso_root
 from src.transform.verification_integration import VerificationIntegration
 from src.transform.article_extractor import ArticleExtractor
-from src.transform.article_builder import update_hierarchical_xml_for_patterns, get_hierarchy_summary
+from src.transform.article_builder import update_hierarchical_xml_for_patterns, get_hierarchy_summary, escape_xml
 
 def extract_chapters_content(pdf_path: str, chapters: list) -> list:
     """
@@ -33,7 +34,7 @@ def extract_chapters_content(pdf_path: str, chapters: list) -> list:
         return []
 
     # Sort chapters by start_line to ensure proper order
-    sorted_chapters = sorted(chapters, key=lambda ch: ch.start_line)
+    sorted_chapters = sorted(chapters, key=attrgetter('start_line'))
 
     chapters_with_content = []
 
@@ -114,9 +115,9 @@ def main():
 
         # Step 3: Transform (T in ETL) - Extract Preamble
         print("3. TRANSFORM: Extracting preamble structure...")
-        numbered_text, _ = extract_text_with_line_numbers(pdf_path)
+        _, _, numbered_lines = extract_text_with_line_numbers(pdf_path)
         preamble_identifier = PreambleIdentifier()
-        preamble_location = preamble_identifier.identify_preamble(numbered_text)
+        preamble_location = preamble_identifier.identify_preamble(numbered_lines)
 
         preamble_text = extract_lines_range(
             pdf_path,
@@ -132,7 +133,7 @@ def main():
         # Step 4: Transform (T in ETL) - Extract Recitals
         print("4. TRANSFORM: Extracting recitals structure...")
         recitals_identifier = RecitalsIdentifier()
-        recitals_location = recitals_identifier.identify_recitals(numbered_text)
+        recitals_location = recitals_identifier.identify_recitals(numbered_lines)
 
         recitals_text = extract_lines_range(
             pdf_path,
@@ -140,8 +141,9 @@ def main():
             recitals_location.end_line
         )
 
-        recitals_summary = get_recitals_summary(recitals_text)
-        recitals_xml = build_recitals_xml(recitals_text)
+        recitals = parse_recitals_text(recitals_text)
+        recitals_summary = get_recitals_summary(recitals_text, recitals)
+        recitals_xml = build_recitals_xml(recitals_text, recitals)
 
         print(f"   Recitals identified (lines {recitals_location.start_line}-{recitals_location.end_line})")
         print(f"   Confidence: {recitals_location.confidence}%")
@@ -249,7 +251,7 @@ def main():
                 # Save chapters with content using proper boundaries
                 chapters_data = []
                 # Sort chapters by start_line to calculate proper boundaries
-                sorted_chapters = sorted(chapters, key=lambda ch: ch.start_line)
+                sorted_chapters = sorted(chapters, key=attrgetter('start_line'))
 
                 for i, chapter in enumerate(sorted_chapters):
                     # Calculate proper end line for this chapter
@@ -318,10 +320,11 @@ def main():
                         print(f"     - {issue}")
 
                 # Save articles as JSON
+                now = datetime.now()
                 articles_json_data = {
                     "document": f"DORA_{metadata.number.replace('/', '_')}",
-                    "extraction_date": datetime.now().strftime("%Y-%m-%d"),
-                    "extraction_timestamp": datetime.now().isoformat(),
+                    "extraction_date": now.strftime("%Y-%m-%d"),
+                    "extraction_timestamp": now.isoformat(),
                     "pattern": "hierarchical" if chapters else "flat",
                     "articles": [
                         {
@@ -372,7 +375,7 @@ def main():
 
         # Combine into complete XML structure with preamble, recitals, and chapters
         preamble_xml = f'''    <preface>
-      <p>{preamble_text.replace('\n', '</p>\n      <p>')}</p>
+      <p>{escape_xml(preamble_text).replace('\n', '</p>\n      <p>')}</p>
     </preface>'''
 
         # Use the generated recitals XML (already formatted)
@@ -414,11 +417,12 @@ def main():
         # Create output directory
         os.makedirs("output", exist_ok=True)
 
-        # Save chapters with content as JSON
+        # Save chapters with content as JSON (chapters and sections share one timestamp)
+        now = datetime.now()
         chapters_json_data = {
             "document": f"DORA_{metadata.number.replace('/', '_')}",
-            "extraction_date": datetime.now().strftime("%Y-%m-%d"),
-            "extraction_timestamp": datetime.now().isoformat(),
+            "extraction_date": now.strftime("%Y-%m-%d"),
+            "extraction_timestamp": now.isoformat(),
             "chapters": chapters_with_content,
             "summary": {
                 "total_chapters": len(chapters_with_content),
@@ -436,8 +440,8 @@ def main():
         # Save sections as JSON
         sections_json_data = {
             "document": f"DORA_{metadata.number.replace('/', '_')}",
-            "extraction_date": datetime.now().strftime("%Y-%m-%d"),
-            "extraction_timestamp": datetime.now().isoformat(),
+            "extraction_date": now.strftime("%Y-%m-%d"),
+            "extraction_timestamp": now.isoformat(),
             "sections": [
                 {
                     "section_number": section.section_number,
@@ -1,35 +1,251 @@
+import hashlib
+import os
+import pickle
 import pdfplumber
+import pypdfium2 as pdfium
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import Tuple, List, Dict
 
+# Environment variable selecting the bulk text backend for extract_text()
+PDF_BACKEND_ENV = "AKN_PDF_BACKEND"
+PDF_BACKENDS = ("pdfium", "pdfplumber")
+
+# Directory for cached line-numbered text (relative to the working directory)
+PDF_CACHE_DIR = ".cache"
+
+# Environment variable that turns the line-numbered text cache off
+PDF_CACHE_ENV = "AKN_PDF_CACHE"
+
+def pdf_cache_enabled() -> bool:
+    """
+    Check whether the line-numbered text cache is enabled.
+
+    Returns:
+        False if AKN_PDF_CACHE is set to "off" (or "0"/"false"), True otherwise
+    """
+    return os.getenv(PDF_CACHE_ENV, "on").strip().lower() not in ("off", "0", "false")
+
 def extract_text(pdf_path: str) -> str:
     """
     Extract all text from a PDF file.
 
+    Uses pdfplumber by default; set AKN_PDF_BACKEND=pdfium for faster extraction.
+    pdfium reads the text in content-stream order, so running headers (such as the
+    Official Journal line) can land later in the text than with pdfplumber.
+    Results are memoized per file path, modification time and backend, so repeated
+    calls on an unchanged PDF skip re-parsing.
+
     Args:
         pdf_path: Path to the PDF file
 
     Returns:
         str: Extracted text from all pages
     """
+    backend = os.getenv(PDF_BACKEND_ENV, "pdfplumber").strip().lower()
+    if backend == "legacy":
+        backend = "pdfplumber"
+    if backend not in PDF_BACKENDS:
+        raise ValueError(f"Unknown {PDF_BACKEND_ENV} '{backend}', expected one of: {', '.join(PDF_BACKENDS)}, legacy")
+
+    real_path = os.path.realpath(pdf_path)
+    return _extract_text_cached(real_path, os.stat(real_path).st_mtime_ns, backend)
+
+@lru_cache(maxsize=8)
+def _extract_text_cached(pdf_path: str, mtime_ns: int, backend: str) -> str:
+    """
+    Extract all text from a PDF file (cached on path, modification time and backend).
+
+    Args:
+        pdf_path: Resolved path to the PDF file
+        mtime_ns: File modification time, part of the cache key only
+        backend: "pdfium" or "pdfplumber"
+
+    Returns:
+        str: Extracted text from all pages
+    """
+    if backend == "pdfium":
+        return _extract_text_pdfium(pdf_path)
+
     text = ""
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
             page_text = page.extract_text()
+            page.close()  # Release the page's parsed layout objects
             if page_text:
                 text += page_text + "\n"
     return text
 
-def extract_text_with_line_numbers(pdf_path: str) -> Tuple[str, Dict[int, Tuple[int, int]]]:
+def _extract_text_pdfium(pdf_path: str) -> str:
+    """
+    Extract all text from a PDF file with pdfium's range-based text extraction.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        str: Extracted text from all pages, newline-terminated per page, with
+            trailing spaces stripped from each line as pdfplumber does
+    """
+    text_parts = []
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        for page_index in range(len(pdf)):
+            page = pdf[page_index]
+            textpage = page.get_textpage()
+            try:
+                page_text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+
+            if page_text:
+                page_lines = page_text.replace('\r\n', '\n').split('\n')
+                text_parts.append("\n".join(line.rstrip() for line in page_lines) + "\n")
+    finally:
+        pdf.close()
+
+    return "".join(text_parts)
+
+def _extract_page_range_texts(pdf_path: str, start_index: int, end_index: int) -> List[str]:
+    """
+    Extract text from a contiguous range of pages (runs in a worker process).
+
+    Args:
+        pdf_path: Path to the PDF file
+        start_index: First page index (0-indexed, inclusive)
+        end_index: Last page index (0-indexed, exclusive)
+
+    Returns:
+        list: Text of each page in the range ("" for pages without text)
+    """
+    with pdfplumber.open(pdf_path) as pdf:
+        page_texts = []
+        for page in pdf.pages[start_index:end_index]:
+            page_texts.append(page.extract_text() or "")
+            page.close()  # Release the page's parsed layout objects
+        return page_texts
+
+def extract_page_texts_parallel(pdf_path: str, max_workers: int = None) -> List[str]:
+    """
+    Extract the text of every page, splitting the pages across worker processes.
+
+    Each worker opens its own PDF handle and parses one contiguous block of pages
+    with pdfplumber, so the output matches page.extract_text() page for page.
+
+    Args:
+        pdf_path: Path to the PDF file
+        max_workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        list: Text of each page in page order ("" for pages without text)
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        page_count = len(pdf)
+    finally:
+        pdf.close()
+
+    workers = max(1, min(max_workers or os.cpu_count() or 1, page_count))
+    if workers == 1:
+        return _extract_page_range_texts(pdf_path, 0, page_count)
+
+    pages_per_worker = -(-page_count // workers)
+    starts = list(range(0, page_count, pages_per_worker))
+    ends = [min(start + pages_per_worker, page_count) for start in starts]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        page_blocks = executor.map(_extract_page_range_texts, [pdf_path] * len(starts), starts, ends)
+        return [page_text for block in page_blocks for page_text in block]
+
+def extract_text_parallel(pdf_path: str, max_workers: int = None) -> str:
+    """
+    Extract all text from a PDF file using multiple processes.
+
+    Produces the same text as the pdfplumber backend of extract_text().
+
+    Args:
+        pdf_path: Path to the PDF file
+        max_workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        str: Extracted text from all pages
+    """
+    page_texts = extract_page_texts_parallel(pdf_path, max_workers)
+    return "".join(page_text + "\n" for page_text in page_texts if page_text)
+
+def extract_text_with_line_numbers(pdf_path: str) -> Tuple[str, Dict[int, Tuple[int, int]], List[str]]:
     """
     Extract text from PDF with line numbers and page mapping.
 
+    Results are memoized in memory and pickled under .cache, keyed on the file's
+    resolved path, modification time and size, so repeated calls (including from
+    later runs) on an unchanged PDF skip re-parsing. Set AKN_PDF_CACHE=off to
+    bypass both and always parse the PDF.
+
     Args:
         pdf_path: Path to the PDF file
 
     Returns:
-        tuple: (numbered_text, line_to_page_mapping)
+        tuple: (numbered_text, line_to_page_mapping, numbered_lines)
             - numbered_text: Text with line numbers prefixed
             - line_to_page_mapping: Dict mapping line numbers to (page_num, line_in_page)
+            - numbered_lines: The lines of numbered_text, for callers that work line by line
+    """
+    if not pdf_cache_enabled():
+        return _extract_text_with_line_numbers(pdf_path)
+
+    real_path = os.path.realpath(pdf_path)
+    stat = os.stat(real_path)
+    numbered_text, line_to_page, numbered_lines = _extract_text_with_line_numbers_cached(real_path, stat.st_mtime_ns, stat.st_size)
+    # Copy the containers so callers cannot alter the cached result
+    return numbered_text, dict(line_to_page), list(numbered_lines)
+
+@lru_cache(maxsize=8)
+def _extract_text_with_line_numbers_cached(pdf_path: str, mtime_ns: int, size: int) -> Tuple[str, Dict[int, Tuple[int, int]], List[str]]:
+    """
+    Extract text with line numbers, reusing the on-disk cache when valid.
+
+    Args:
+        pdf_path: Resolved path to the PDF file
+        mtime_ns: File modification time, part of the cache key only
+        size: File size in bytes, part of the cache key only
+
+    Returns:
+        tuple: (numbered_text, line_to_page_mapping, numbered_lines)
+    """
+    key_source = f"{pdf_path}:{mtime_ns}:{size}"
+    key = hashlib.blake2b(key_source.encode('utf-8'), digest_size=16).hexdigest()
+    cache_path = os.path.join(PDF_CACHE_DIR, f"numbered_lines_{key}.pkl")
+
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass  # Missing or corrupt cache: extract from the PDF
+
+    result = _extract_text_with_line_numbers(pdf_path)
+
+    try:
+        os.makedirs(PDF_CACHE_DIR, exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Could not cache PDF line numbers: {e}")
+
+    return result
+
+def _extract_text_with_line_numbers(pdf_path: str) -> Tuple[str, Dict[int, Tuple[int, int]], List[str]]:
+    """
+    Extract text from PDF with line numbers and page mapping (uncached).
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        tuple: (numbered_text, line_to_page_mapping, numbered_lines)
     """
     numbered_lines = []
     line_to_page = {}
@@ -38,6 +254,7 @@ def extract_text_with_line_numbers(pdf_path: str) -> Tuple[str, Dict[int, Tuple[
     with pdfplumber.open(pdf_path) as pdf:
         for page_num, page in enumerate(pdf.pages, 1):
             page_text = page.extract_text()
+            page.close()  # Release the page's parsed layout objects
             if page_text:
                 page_lines = page_text.split('\n')
                 for line_in_page, line in enumerate(page_lines, 1):
@@ -46,7 +263,7 @@ def extract_text_with_line_numbers(pdf_path: str) -> Tuple[str, Dict[int, Tuple[
                         line_to_page[current_line] = (page_num, line_in_page)
                         current_line += 1
 
-    return "\n".join(numbered_lines), line_to_page
+    return "\n".join(numbered_lines), line_to_page, numbered_lines
 
 def extract_lines_range(pdf_path: str, start_line: int, end_line: int) -> str:
     """
@@ -60,8 +277,7 @@ def extract_lines_range(pdf_path: str, start_line: int, end_line: int) -> str:
     Returns:
         str: Extracted text from the specified line range
     """
-    numbered_text, _ = extract_text_with_line_numbers(pdf_path)
-    lines = numbered_text.split('\n')
+    _, _, lines = extract_text_with_line_numbers(pdf_path)
 
     # Filter lines within the range
     extracted_lines = []
@@ -0,0 +1,114 @@
+"""
+Persistent on-disk cache for structured LLM responses.
+
+Each response is stored as JSON under .cache/llm, keyed by a hash of the model,
+the prompt messages and the response model. Re-running an extraction over the same
+document then skips the LLM round-trip. Set AKN_LLM_CACHE=off to bypass the cache
+and force fresh calls.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Type, TypeVar
+from pydantic import BaseModel, ValidationError
+
+LLM_CACHE_DIR = os.path.join(".cache", "llm")
+LLM_CACHE_ENV = "AKN_LLM_CACHE"
+
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
+
+
+def llm_cache_enabled() -> bool:
+    """
+    Check whether the LLM cache is enabled.
+
+    Returns:
+        False if AKN_LLM_CACHE is set to "off" (or "0"/"false"), True otherwise
+    """
+    return os.getenv(LLM_CACHE_ENV, "on").strip().lower() not in ("off", "0", "false")
+
+
+def _cache_path(model: str, response_model: Type[BaseModel], messages: List[Dict[str, str]]) -> str:
+    """
+    Get the cache file for one LLM request.
+
+    Args:
+        model: Model name
+        response_model: Pydantic model the response is parsed into
+        messages: Chat messages sent to the model
+
+    Returns:
+        Cache file path
+    """
+    payload = json.dumps(
+        [model, response_model.__name__, messages],
+        ensure_ascii=False,
+        sort_keys=True
+    )
+    key = hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(LLM_CACHE_DIR, f"{key}.json")
+
+
+def _load(cache_path: str, response_model: Type[ResponseModel]) -> Optional[ResponseModel]:
+    """
+    Read a cached response.
+
+    Args:
+        cache_path: Cache file path
+        response_model: Pydantic model to validate the cached JSON against
+
+    Returns:
+        Parsed response, or None if missing or unreadable
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return response_model.model_validate_json(f.read())
+    except (OSError, ValidationError):
+        return None
+
+
+def _save(cache_path: str, result: BaseModel) -> None:
+    """
+    Write a response to the cache (best effort).
+
+    Args:
+        cache_path: Cache file path
+        result: Parsed LLM response
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(result.model_dump_json())
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Could not cache LLM response: {e}")
+
+
+def cached_completion(client, model: str, response_model: Type[ResponseModel], messages: List[Dict[str, str]]) -> ResponseModel:
+    """
+    Run a structured chat completion, reusing a cached response when available.
+
+    Errors from the LLM call propagate and nothing is cached for them.
+
+    Args:
+        client: Instructor-patched OpenAI client
+        model: Model name
+        response_model: Pydantic model to parse the response into
+        messages: Chat messages to send
+
+    Returns:
+        Parsed response (a fresh object, safe for the caller to modify)
+    """
+    if not llm_cache_enabled():
+        return client.chat.completions.create(model=model, response_model=response_model, messages=messages)
+
+    cache_path = _cache_path(model, response_model, messages)
+    cached = _load(cache_path, response_model)
+    if cached is not None:
+        return cached
+
+    result = client.chat.completions.create(model=model, response_model=response_model, messages=messages)
+    _save(cache_path, result)
+    return result
@@ -0,0 +1,109 @@
+"""
+Optional RE2 backend for the line-classification patterns.
+
+The paragraph patterns are strictly regular (no backreferences or lookaround), so
+when the google-re2 package is installed they are compiled with RE2, which matches
+in linear time without backtracking. Without it, or for a pattern RE2 rejects, the
+standard library re module is used; so is it for a pattern whose word or word-boundary
+escapes would match differently under RE2. Callers only rely on match/search, group and
+lastgroup, which both engines provide.
+"""
+
+import re
+
+try:
+    import re2
+except ImportError:  # optional dependency
+    re2 = None
+
+# RE2's \s and \d are ASCII-only; Python's match every str.isspace() character and
+# every Unicode decimal digit. Spell the Python sets out so both engines classify
+# lines identically.
+_UNICODE_WHITESPACE = r'\t-\r\x1c-\x1f \x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}'
+_UNICODE_DIGIT = r'\p{Nd}'
+
+# Escape letter -> (set contents, whether the escape is the negated set)
+_CLASS_ESCAPES = {
+    's': (_UNICODE_WHITESPACE, False),
+    'S': (_UNICODE_WHITESPACE, True),
+    'd': (_UNICODE_DIGIT, False),
+    'D': (_UNICODE_DIGIT, True),
+}
+
+# Escapes whose RE2 meaning differs from re and that have no rewrite here
+_ASCII_ONLY_ESCAPES = frozenset('wWbB')
+
+
+def _to_re2_syntax(pattern: str):
+    """
+    Rewrite the whitespace and digit escapes (and their negations) so RE2 matches
+    the same characters as re.
+
+    Escaped backslashes are copied as-is. Inside a character class the set contents
+    are spliced in; outside, the escape becomes a bracketed class.
+
+    Args:
+        pattern: Regular expression in re syntax
+
+    Returns:
+        Equivalent RE2 pattern, or None if it cannot be expressed (a negated escape
+        inside a class, or a word or word-boundary escape)
+    """
+    parts = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\' and i + 1 < len(pattern):
+            escape = pattern[i + 1]
+            if escape in _ASCII_ONLY_ESCAPES:
+                return None
+            if escape in _CLASS_ESCAPES:
+                contents, negated = _CLASS_ESCAPES[escape]
+                if in_class:
+                    if negated:
+                        return None
+                    parts.append(contents)
+                else:
+                    parts.append(f"[{'^' if negated else ''}{contents}]")
+            else:
+                parts.append(pattern[i:i + 2])
+            i += 2
+            continue
+
+        if in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            # A ']' right after '[' or '[^' is a literal member, not the end of the set
+            in_class = True
+            end = i + 2 if pattern.startswith('[^', i) else i + 1
+            if pattern.startswith(']', end):
+                end += 1
+            parts.append(pattern[i:end])
+            i = end
+            continue
+        parts.append(char)
+        i += 1
+
+    return ''.join(parts)
+
+
+def compile_pattern(pattern: str):
+    """
+    Compile a regex with RE2 when available, falling back to re.
+
+    Args:
+        pattern: Regular expression without flags, backreferences or lookaround
+
+    Returns:
+        Compiled pattern object
+    """
+    if re2 is not None:
+        re2_pattern = _to_re2_syntax(pattern)
+        if re2_pattern is not None:
+            try:
+                return re2.compile(re2_pattern)
+            except re2.error:
+                pass
+    return re.compile(pattern)
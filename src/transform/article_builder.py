@@ -1,6 +1,25 @@
+from collections import Counter
+from operator import attrgetter
 from typing import List, Dict
 from .models import ArticleInfo, ChapterInfo, SectionInfo, ParagraphInfo
 
+# Element headers, formatted in one call per element. The article header is
+# unindented and gets its nesting indent from _extend_indented.
+_CHAPTER_HEADER_TMPL = (
+    '      <chapter id="chp_{number}">\n'
+    '        <num>CHAPTER {number}</num>\n'
+    '        <heading>{title}</heading>'
+)
+_SECTION_HEADER_TMPL = (
+    '        <section id="sec_{chapter}_{number}">\n'
+    '          <num>Section {number}</num>'
+)
+_ARTICLE_HEADER_TMPL = (
+    '<article id="art_{number}">\n'
+    '  <num>{number}</num>\n'
+    '  <heading>{title}</heading>'
+)
+
 def build_hierarchical_xml(
     chapters: List[ChapterInfo],
     sections: List[SectionInfo],
@@ -30,7 +49,7 @@ def build_hierarchical_xml(
 
     # Sort sections within each chapter by start line
     for chapter_num in sections_by_chapter:
-        sections_by_chapter[chapter_num].sort(key=lambda s: s.start_line)
+        sections_by_chapter[chapter_num].sort(key=attrgetter('start_line'))
 
     # Group articles by chapter and section
     articles_by_chapter = {}
@@ -53,18 +72,12 @@ def build_hierarchical_xml(
             articles_by_section[section_key].append(article)
 
     # Sort chapters by start line
-    sorted_chapters = sorted(chapters, key=lambda ch: ch.start_line)
+    sorted_chapters = sorted(chapters, key=attrgetter('start_line'))
 
     xml_parts = ["    <body>"]
 
     for chapter in sorted_chapters:
-        chapter_id = f"chp_{chapter.chapter_number}"
-
-        xml_parts.extend([
-            f'      <chapter id="{chapter_id}">',
-            f'        <num>CHAPTER {chapter.chapter_number}</num>',
-            f'        <heading>{chapter.title}</heading>'
-        ])
+        xml_parts.append(_CHAPTER_HEADER_TMPL.format(number=chapter.chapter_number, title=escape_xml(chapter.title)))
 
         # Check if this chapter has sections
         chapter_sections = sections_by_chapter.get(chapter.chapter_number, [])
@@ -72,12 +85,7 @@ def build_hierarchical_xml(
         if chapter_sections:
             # Chapter has sections - nest articles under sections
             for section in chapter_sections:
-                section_id = f"sec_{chapter.chapter_number}_{section.section_number}"
-
-                xml_parts.extend([
-                    f'        <section id="{section_id}">',
-                    f'          <num>Section {section.section_number}</num>'
-                ])
+                xml_parts.append(_SECTION_HEADER_TMPL.format(chapter=chapter.chapter_number, number=section.section_number))
 
                 # Add articles for this section
                 section_key = f"{chapter.chapter_number}_{section.section_number}"
@@ -85,13 +93,11 @@ def build_hierarchical_xml(
 
                 if section_articles:
                     # Sort articles by article number
-                    sorted_articles = sorted(section_articles, key=lambda art: art.article_number)
+                    sorted_articles = sorted(section_articles, key=attrgetter('article_number'))
 
                     for article in sorted_articles:
-                        article_xml = build_article_xml(article)
-                        # Indent article XML properly within section
-                        indented_article = '\n'.join('          ' + line for line in article_xml.split('\n') if line.strip())
-                        xml_parts.append(indented_article)
+                        # Emit article lines directly at section depth
+                        _extend_indented(xml_parts, _article_xml_parts(article), '          ')
                 else:
                     xml_parts.append('          <!-- No articles in this section -->')
 
@@ -106,13 +112,11 @@ def build_hierarchical_xml(
 
                 if direct_articles:
                     # Sort articles by article number
-                    sorted_articles = sorted(direct_articles, key=lambda art: art.article_number)
+                    sorted_articles = sorted(direct_articles, key=attrgetter('article_number'))
 
                     for article in sorted_articles:
-                        article_xml = build_article_xml(article)
-                        # Indent article XML properly within chapter
-                        indented_article = '\n'.join('        ' + line for line in article_xml.split('\n') if line.strip())
-                        xml_parts.append(indented_article)
+                        # Emit article lines directly at chapter depth
+                        _extend_indented(xml_parts, _article_xml_parts(article), '        ')
                 else:
                     xml_parts.append('        <!-- No direct articles in this chapter -->')
             else:
@@ -124,76 +128,47 @@ def build_hierarchical_xml(
 
     return '\n'.join(xml_parts)
 
-def build_articles_only_xml(articles: List[ArticleInfo]) -> str:
+def build_article_xml(article: ArticleInfo) -> str:
     """
-    Build XML for documents with articles but no chapters (flat structure).
+    Build XML structure for a single article with full content.
 
     Args:
-        articles: List of ArticleInfo objects
+        article: ArticleInfo object with raw_content
 
     Returns:
-        XML string with articles directly under body
+        XML string for the article
     """
-    if not articles:
-        return "    <body>\n      <!-- No articles found -->\n    </body>"
+    return '\n'.join(_article_xml_parts(article))
 
-    xml_parts = ["    <body>"]
-
-    # Sort articles by article number
-    sorted_articles = sorted(articles, key=lambda art: art.article_number)
-
-    for article in sorted_articles:
-        article_xml = build_article_xml(article)
-        # Indent article XML properly within body
-        indented_article = '\n'.join('      ' + line for line in article_xml.split('\n') if line.strip())
-        xml_parts.append(indented_article)
-
-    xml_parts.append("    </body>")
-
-    return '\n'.join(xml_parts)
-
-def update_hierarchical_xml_for_patterns(
-    chapters: List[ChapterInfo],
-    sections: List[SectionInfo],
-    articles: List[ArticleInfo]
-) -> str:
+def _extend_indented(xml_parts: List[str], lines: List[str], indent: str) -> None:
     """
-    Updated hierarchical XML builder that handles both patterns:
-    Pattern 1: Chapters exist → use hierarchical structure
-    Pattern 2: No chapters → use flat article structure
+    Append lines to xml_parts at the given indent, skipping blank lines.
 
-    Args:
-        chapters: List of ChapterInfo objects (may be empty)
-        sections: List[SectionInfo] objects (may be empty)
-        articles: List of ArticleInfo objects
+    Lines containing embedded newlines (e.g. multi-line titles) are split first, so the
+    result matches indenting the joined XML line by line.
 
-    Returns:
-        XML string with appropriate structure
+    Args:
+        xml_parts: Accumulator to extend
+        lines: XML lines to add
+        indent: Indentation prefix for each line
     """
-    if not chapters or len(chapters) == 0:
-        # Pattern 2: No chapters, build flat article structure
-        return build_articles_only_xml(articles)
-    else:
-        # Pattern 1: Chapters exist, use existing hierarchical structure
-        return build_hierarchical_xml(chapters, sections, articles)
+    for line in lines:
+        if '\n' in line:
+            xml_parts.extend(indent + sub_line for sub_line in line.split('\n') if sub_line.strip())
+        elif line.strip():
+            xml_parts.append(indent + line)
 
-def build_article_xml(article: ArticleInfo) -> str:
+def _article_xml_parts(article: ArticleInfo) -> List[str]:
     """
-    Build XML structure for a single article with full content.
+    Build the XML lines for a single article, unindented.
 
     Args:
         article: ArticleInfo object with raw_content
 
     Returns:
-        XML string for the article
+        List of XML lines for the article
     """
-    article_id = f"art_{article.article_number}"
-
-    xml_parts = [
-        f'<article id="{article_id}">',
-        f'  <num>{article.article_number}</num>',
-        f'  <heading>{escape_xml(article.title)}</heading>'
-    ]
+    xml_parts = [_ARTICLE_HEADER_TMPL.format(number=article.article_number, title=escape_xml(article.title))]
 
     # Parse and add article content (prefer structured paragraphs)
     if hasattr(article, 'paragraphs') and article.paragraphs:
@@ -211,7 +186,7 @@ def build_article_xml(article: ArticleInfo) -> str:
 
     xml_parts.append('</article>')
 
-    return '\n'.join(xml_parts)
+    return xml_parts
 
 def parse_article_content(raw_content: str, article_number: int, paragraphs: List = None) -> str:
     """
@@ -256,7 +231,7 @@ def build_paragraphs_xml(paragraphs: List, article_number: int) -> str:
 
     return '\n'.join(xml_parts)
 
-def build_paragraph_xml(paragraph, article_number: int, fallback_id: int) -> List[str]:
+def build_paragraph_xml(paragraph, article_number: int, fallback_id: int, indent: str = '') -> List[str]:
     """
     Build XML for a single paragraph with sub-paragraphs.
 
@@ -264,6 +239,7 @@ def build_paragraph_xml(paragraph, article_number: int, fallback_id: int) -> Lis
         paragraph: ParagraphInfo object
         article_number: Article number
         fallback_id: Fallback ID if no paragraph number
+        indent: Prefix for every line (sub-paragraphs are nested two spaces deeper)
 
     Returns:
         List of XML lines
@@ -279,29 +255,27 @@ def build_paragraph_xml(paragraph, article_number: int, fallback_id: int) -> Lis
         para_id = f"art_{article_number}_par_{fallback_id}"
 
     # Start paragraph element
-    xml_parts.append(f'<paragraph id="{para_id}">')
+    xml_parts.append(f'{indent}<paragraph id="{para_id}">')
 
     # Add number if it exists
     if paragraph.paragraph_number and not paragraph.is_introductory:
-        xml_parts.append(f'  <num>{escape_xml(paragraph.paragraph_number)}</num>')
+        xml_parts.append(f'{indent}  <num>{escape_xml(paragraph.paragraph_number)}</num>')
 
     # Add content
     xml_parts.extend([
-        f'  <content>',
-        f'    <p>{escape_xml(paragraph.content)}</p>',
-        f'  </content>'
+        f'{indent}  <content>',
+        f'{indent}    <p>{escape_xml(paragraph.content)}</p>',
+        f'{indent}  </content>'
     ])
 
-    # Add sub-paragraphs recursively
+    # Add sub-paragraphs recursively, built directly at their nesting indent
     if paragraph.sub_paragraphs:
+        sub_indent = indent + '  '
         for j, sub_para in enumerate(paragraph.sub_paragraphs):
-            # Indent sub-paragraph XML
-            sub_xml = build_paragraph_xml(sub_para, article_number, j + 1)
-            indented_sub_xml = ['  ' + line for line in sub_xml]
-            xml_parts.extend(indented_sub_xml)
+            xml_parts.extend(build_paragraph_xml(sub_para, article_number, j + 1, sub_indent))
 
     # Close paragraph element
-    xml_parts.append('</paragraph>')
+    xml_parts.append(f'{indent}</paragraph>')
 
     return xml_parts
 
@@ -394,6 +368,9 @@ def escape_xml(text: str) -> str:
     if not text:
         return ""
 
+    # Chained replace beats a single str.translate here: each replace is a C-level
+    # search that returns the string as-is when the character is absent, while
+    # translate with a mapping table does a per-character lookup over the whole text
     return (text
             .replace('&', '&amp;')
             .replace('<', '&lt;')
@@ -413,47 +390,29 @@ def get_hierarchy_summary(chapters: List[ChapterInfo], sections: List[SectionInf
     Returns:
         Dictionary with hierarchy summary statistics
     """
-    # Group sections by chapter
-    sections_by_chapter = {}
-    for section in sections:
-        chapter = section.parent_chapter
-        if chapter not in sections_by_chapter:
-            sections_by_chapter[chapter] = []
-        sections_by_chapter[chapter].append(section)
+    # Chapters that have sections, in order of first appearance
+    chapters_with_sections = list(dict.fromkeys(section.parent_chapter for section in sections))
+    chapters_with_sections_set = set(chapters_with_sections)
 
-    # Group articles by chapter and section
-    articles_by_chapter = {}
-    articles_by_section = {}
+    # Count articles by chapter and section (Counter tallies in C, keeping first-seen order)
+    articles_by_chapter = Counter(map(attrgetter('parent_chapter'), articles))
+    articles_by_section = dict(Counter(
+        f"{article.parent_chapter}_{article.parent_section}" for article in articles if article.parent_section
+    ))
+    articles_under_sections = sum(articles_by_section.values())
 
-    for article in articles:
-        chapter = article.parent_chapter
-        section = article.parent_section
-
-        # Group by chapter
-        if chapter not in articles_by_chapter:
-            articles_by_chapter[chapter] = []
-        articles_by_chapter[chapter].append(article)
-
-        # Group by section if applicable
-        if section:
-            section_key = f"{chapter}_{section}"
-            if section_key not in articles_by_section:
-                articles_by_section[section_key] = []
-            articles_by_section[section_key].append(article)
-
-    chapters_with_sections = list(sections_by_chapter.keys())
-    chapters_without_sections = [ch.chapter_number for ch in chapters if ch.chapter_number not in chapters_with_sections]
+    chapter_numbers = [ch.chapter_number for ch in chapters]
 
     return {
         "total_chapters": len(chapters),
         "total_sections": len(sections),
         "total_articles": len(articles),
         "chapters_with_sections": chapters_with_sections,
-        "chapters_without_sections": chapters_without_sections,
-        "articles_by_chapter": {ch: len(articles_by_chapter.get(ch, [])) for ch in [c.chapter_number for c in chapters]},
-        "articles_by_section": {key: len(arts) for key, arts in articles_by_section.items()},
-        "articles_under_sections": len([art for art in articles if art.parent_section]),
-        "articles_under_chapters": len([art for art in articles if not art.parent_section])
+        "chapters_without_sections": [num for num in chapter_numbers if num not in chapters_with_sections_set],
+        "articles_by_chapter": {num: articles_by_chapter.get(num, 0) for num in chapter_numbers},
+        "articles_by_section": articles_by_section,
+        "articles_under_sections": articles_under_sections,
+        "articles_under_chapters": len(articles) - articles_under_sections
     }
 
 def validate_hierarchy_xml(xml_content: str) -> dict:
@@ -511,30 +470,22 @@ def build_chapters_with_articles_xml(chapters: List[ChapterInfo], articles: List
         articles_by_chapter[chapter].append(article)
 
     # Sort chapters by start line
-    sorted_chapters = sorted(chapters, key=lambda ch: ch.start_line)
+    sorted_chapters = sorted(chapters, key=attrgetter('start_line'))
 
     xml_parts = ["    <body>"]
 
     for chapter in sorted_chapters:
-        chapter_id = f"chp_{chapter.chapter_number}"
-
-        xml_parts.extend([
-            f'      <chapter id="{chapter_id}">',
-            f'        <num>CHAPTER {chapter.chapter_number}</num>',
-            f'        <heading>{chapter.title}</heading>'
-        ])
+        xml_parts.append(_CHAPTER_HEADER_TMPL.format(number=chapter.chapter_number, title=escape_xml(chapter.title)))
 
         # Add articles for this chapter
         chapter_articles = articles_by_chapter.get(chapter.chapter_number, [])
         if chapter_articles:
             # Sort articles by article number
-            sorted_articles = sorted(chapter_articles, key=lambda art: art.article_number)
+            sorted_articles = sorted(chapter_articles, key=attrgetter('article_number'))
 
             for article in sorted_articles:
-                article_xml = build_article_xml(article)
-                # Indent article XML properly within chapter
-                indented_article = '\n'.join('        ' + line for line in article_xml.split('\n') if line.strip())
-                xml_parts.append(indented_article)
+                # Emit article lines directly at chapter depth
+                _extend_indented(xml_parts, _article_xml_parts(article), '        ')
         else:
             xml_parts.append('        <!-- No articles in this chapter -->')
 
@@ -560,13 +511,11 @@ def build_articles_only_xml(articles: List[ArticleInfo]) -> str:
     xml_parts = ["    <body>"]
 
     # Sort articles by article number
-    sorted_articles = sorted(articles, key=lambda art: art.article_number)
+    sorted_articles = sorted(articles, key=attrgetter('article_number'))
 
     for article in sorted_articles:
-        article_xml = build_article_xml(article)
-        # Indent article XML properly within body
-        indented_article = '\n'.join('      ' + line for line in article_xml.split('\n') if line.strip())
-        xml_parts.append(indented_article)
+        # Emit article lines directly at body depth
+        _extend_indented(xml_parts, _article_xml_parts(article), '      ')
 
     xml_parts.append("    </body>")
 
@@ -1,12 +1,15 @@
 import instructor
-from openai import OpenAI
 import os
 import json
 from dotenv import load_dotenv
+from operator import attrgetter, itemgetter
 from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
 from pydantic import BaseModel, Field
 from .models import ArticleInfo, ArticlesInChapter, SectionInfo, ParagraphInfo
 from .paragraph_extractor import ParagraphExtractor
+from .llm_client import get_openai_client
+from ._llm_cache import cached_completion
 
 load_dotenv()
 
@@ -15,12 +18,7 @@ class ArticleExtractor:
 
     def __init__(self):
         """Initialize with OpenRouter client using GPT-4"""
-        self.client = instructor.from_openai(
-            OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=os.getenv("OPENROUTER_API_KEY"),
-            )
-        )
+        self.client = instructor.from_openai(get_openai_client())
         self.model = "openai/gpt-4o-mini"
 
         # Initialize paragraph extractor
@@ -62,7 +60,8 @@ class ArticleExtractor:
             ArticlesInChapter with all articles found
         """
         try:
-            result = self.client.chat.completions.create(
+            result = cached_completion(
+                self.client,
                 model=self.model,
                 response_model=ArticlesInChapter,
                 messages=[
@@ -163,7 +162,7 @@ Be very conservative - only include if you're 100% certain it's a real header.""
 
         # Sort sections within each chapter by start line
         for chapter_num in sections_by_chapter:
-            sections_by_chapter[chapter_num].sort(key=lambda s: s.start_line)
+            sections_by_chapter[chapter_num].sort(key=attrgetter('start_line'))
 
         # Assign parent sections
         for article in articles:
@@ -206,7 +205,7 @@ Be very conservative - only include if you're 100% certain it's a real header.""
 
         return None
 
-    def extract_all_articles(self, chapters_json_path: str, sections_json_path: str) -> List[ArticleInfo]:
+    def extract_all_articles(self, chapters_json_path: str, sections_json_path: str, max_workers: int = 4) -> List[ArticleInfo]:
         """
         Extract all articles from all chapters with proper section assignment.
         Uses hybrid approach: LLM for article identification + pattern matching for accurate line numbers.
@@ -214,6 +213,7 @@ Be very conservative - only include if you're 100% certain it's a real header.""
         Args:
             chapters_json_path: Path to chapters content JSON
             sections_json_path: Path to sections JSON
+            max_workers: Maximum number of chapters sent to the LLM concurrently (default: 4)
 
         Returns:
             List of all ArticleInfo with proper parent_chapter and parent_section
@@ -230,28 +230,28 @@ Be very conservative - only include if you're 100% certain it's a real header.""
         print(f"\n--- Step 1: LLM Article Identification ---")
         llm_articles = []
 
-        for chapter_data in chapters_data:
-            chapter_number = chapter_data['chapter_number']
-            chapter_content = chapter_data['content']
-            chapter_start_line = chapter_data['start_line']
-
-            print(f"\nProcessing Chapter {chapter_number}: {chapter_data['title']}")
-
-            # Extract articles using LLM (for titles)
-            articles_in_chapter = self.extract_articles_from_chapter(
-                chapter_content,
-                chapter_number,
-                chapter_start_line
+        # The LLM calls are network-bound, so run them on threads; map keeps chapter order
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chapter_results = executor.map(
+                lambda chapter_data: self.extract_articles_from_chapter(
+                    chapter_data['content'],
+                    chapter_data['chapter_number'],
+                    chapter_data['start_line']
+                ),
+                chapters_data
             )
 
-            if articles_in_chapter.has_articles:
-                print(f"LLM found {len(articles_in_chapter.articles)} articles:")
-                for article in articles_in_chapter.articles:
-                    print(f"  Article {article.article_number}: {article.title}")
+            for chapter_data, articles_in_chapter in zip(chapters_data, chapter_results):
+                print(f"\nProcessing Chapter {chapter_data['chapter_number']}: {chapter_data['title']}")
 
-                llm_articles.extend(articles_in_chapter.articles)
-            else:
-                print("No articles found by LLM")
+                if articles_in_chapter.has_articles:
+                    print(f"LLM found {len(articles_in_chapter.articles)} articles:")
+                    for article in articles_in_chapter.articles:
+                        print(f"  Article {article.article_number}: {article.title}")
+
+                    llm_articles.extend(articles_in_chapter.articles)
+                else:
+                    print("No articles found by LLM")
 
         # Step 2: Use pattern matching to get accurate line numbers
         print(f"\n--- Step 2: Pattern Matching for Accurate Line Numbers ---")
@@ -263,7 +263,7 @@ Be very conservative - only include if you're 100% certain it's a real header.""
 
         # Show final assignment
         print(f"\n--- Final Article Assignment ---")
-        for article in sorted(corrected_articles, key=lambda a: (a.parent_chapter, a.article_number)):
+        for article in sorted(corrected_articles, key=attrgetter('parent_chapter', 'article_number')):
             section_info = f"Section {article.parent_section}" if article.parent_section else "Direct under chapter"
             print(f"Article {article.article_number} in Chapter {article.parent_chapter}: {section_info}")
 
@@ -286,9 +286,9 @@ Be very conservative - only include if you're 100% certain it's a real header.""
         print("Loading PDF for pattern matching...")
 
         # Load PDF content
-        pdf_text, _ = extract_text_with_line_numbers("data/dora/level1/DORA_Regulation_EU_2022_2554.pdf")
+        _, _, numbered_lines = extract_text_with_line_numbers("data/dora/level1/DORA_Regulation_EU_2022_2554.pdf")
         pdf_lines = {}
-        for line in pdf_text.split('\n'):
+        for line in numbered_lines:
             if ': ' in line:
                 parts = line.split(': ', 1)
                 try:
@@ -314,7 +314,7 @@ Be very conservative - only include if you're 100% certain it's a real header.""
 
         # Create chapter boundaries
         chapter_boundaries = {}
-        sorted_chapters = sorted(chapters_data, key=lambda ch: ch['start_line'])
+        sorted_chapters = sorted(chapters_data, key=itemgetter('start_line'))
         for i, chapter in enumerate(sorted_chapters):
             chapter_num = chapter['chapter_number']
             start_line = chapter['start_line']
@@ -326,7 +326,8 @@ Be very conservative - only include if you're 100% certain it's a real header.""
         corrections_made = 0
 
         for article in llm_articles:
-            corrected_article = ArticleInfo(
+            # Copies fields of an already validated ArticleInfo, so skip re-validation
+            corrected_article = ArticleInfo.model_construct(
                 article_number=article.article_number,
                 title=article.title,
                 start_line=article.start_line,  # Will be corrected below
@@ -376,15 +377,14 @@ Be very conservative - only include if you're 100% certain it's a real header.""
         print("Extracting article content...")
 
         # Sort articles by line number to determine boundaries
-        sorted_articles = sorted(articles, key=lambda a: a.start_line)
+        sorted_articles = sorted(articles, key=attrgetter('start_line'))
 
-        for i, article in enumerate(sorted_articles):
-            # Determine end line for this article
-            if i + 1 < len(sorted_articles):
-                end_line = sorted_articles[i + 1].start_line - 1
-            else:
-                end_line = max(pdf_lines.keys())  # Last article goes to end
+        # Each article ends the line before the next one starts; the last goes to the end
+        end_lines = [next_article.start_line - 1 for next_article in sorted_articles[1:]]
+        if sorted_articles:
+            end_lines.append(max(pdf_lines.keys()))
 
+        for article, end_line in zip(sorted_articles, end_lines):
             # Extract content from start_line to end_line
             content_lines = []
             for line_num in range(article.start_line, end_line + 1):
@@ -427,12 +427,11 @@ Be very conservative - only include if you're 100% certain it's a real header.""
 
         for chapter, chapter_articles in articles_by_chapter.items():
             # Sort by article number
-            sorted_articles = sorted(chapter_articles, key=lambda art: art.article_number)
+            sorted_articles = sorted(chapter_articles, key=attrgetter('article_number'))
             article_numbers = [art.article_number for art in sorted_articles]
 
             # Check for sequential numbering (starting from 1)
-            expected_sequence = list(range(1, len(article_numbers) + 1))
-            is_sequential = article_numbers == expected_sequence
+            is_sequential = all(number == expected for expected, number in enumerate(article_numbers, 1))
 
             # Count section assignments
             with_sections = len([art for art in chapter_articles if art.parent_section])
@@ -453,8 +452,8 @@ Be very conservative - only include if you're 100% certain it's a real header.""
             if not is_sequential:
                 validation["validation_issues"].append(f"Chapter {chapter}: Non-sequential numbering {article_numbers}")
 
-            # Check for duplicates
-            if len(article_numbers) != len(set(article_numbers)):
+            # Check for duplicates (a sequential list has none)
+            if not is_sequential and len(article_numbers) != len(set(article_numbers)):
                 validation["validation_issues"].append(f"Chapter {chapter}: Duplicate article numbers")
 
         return validation
@@ -474,11 +473,11 @@ Be very conservative - only include if you're 100% certain it's a real header.""
 
         # Load PDF content
         from ..pdf_extractor import extract_text_with_line_numbers
-        pdf_text, _ = extract_text_with_line_numbers(pdf_path)
+        _, _, numbered_lines = extract_text_with_line_numbers(pdf_path)
 
         # Parse PDF lines
         pdf_lines = {}
-        for line in pdf_text.split('\n'):
+        for line in numbered_lines:
             if ': ' in line:
                 parts = line.split(': ', 1)
                 try:
@@ -618,15 +617,14 @@ If this appears to be a reference rather than a header, mark is_valid_article as
         print("Extracting article content for flat structure...")
 
         # Sort articles by line number to determine boundaries
-        sorted_articles = sorted(articles, key=lambda a: a.start_line)
+        sorted_articles = sorted(articles, key=attrgetter('start_line'))
 
-        for i, article in enumerate(sorted_articles):
-            # Determine end line for this article
-            if i + 1 < len(sorted_articles):
-                end_line = sorted_articles[i + 1].start_line - 1
-            else:
-                end_line = max(pdf_lines.keys())  # Last article goes to end
+        # Each article ends the line before the next one starts; the last goes to the end
+        end_lines = [next_article.start_line - 1 for next_article in sorted_articles[1:]]
+        if sorted_articles:
+            end_lines.append(max(pdf_lines.keys()))
 
+        for article, end_line in zip(sorted_articles, end_lines):
             # Extract content from start_line to end_line
             content_lines = []
             for line_num in range(article.start_line, end_line + 1):
@@ -1,5 +1,26 @@
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from operator import attrgetter
 from typing import List
 from .models import ChapterInfo, SectionInfo
+from .article_builder import escape_xml
+
+@dataclass(slots=True)
+class ChapterXmlValidation:
+    """Result of validate_chapter_xml; also readable as validation["key"] like the dict it replaces"""
+
+    has_body: bool
+    has_chapters: bool
+    chapter_count: int
+    has_headings: bool
+    has_nums: bool
+    is_well_formed: bool
+    all_chapters_complete: bool
+
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
 
 def build_chapters_xml(chapters: List[ChapterInfo]) -> str:
     """
@@ -15,7 +36,7 @@ def build_chapters_xml(chapters: List[ChapterInfo]) -> str:
         return "    <body>\n      <!-- No chapters found -->\n    </body>"
 
     # Sort chapters by line number to ensure proper order
-    sorted_chapters = sorted(chapters, key=lambda ch: ch.start_line)
+    sorted_chapters = sorted(chapters, key=attrgetter('start_line'))
 
     xml_parts = ["    <body>"]
 
@@ -26,7 +47,7 @@ def build_chapters_xml(chapters: List[ChapterInfo]) -> str:
         xml_parts.extend([
             f'      <chapter id="{chapter_id}">',
             f'        <num>CHAPTER {chapter.chapter_number}</num>',
-            f'        <heading>{chapter.title}</heading>',
+            f'        <heading>{escape_xml(chapter.title)}</heading>',
             '      </chapter>'
         ])
 
@@ -56,7 +77,7 @@ def get_chapters_summary(chapters: List[ChapterInfo]) -> dict:
         }
 
     # Sort by line number
-    sorted_chapters = sorted(chapters, key=lambda ch: ch.start_line)
+    sorted_chapters = sorted(chapters, key=attrgetter('start_line'))
 
     pages = [ch.page_number for ch in chapters]
     confidences = [ch.confidence for ch in chapters]
@@ -71,36 +92,56 @@ def get_chapters_summary(chapters: List[ChapterInfo]) -> dict:
         "line_range": (sorted_chapters[0].start_line, sorted_chapters[-1].start_line)
     }
 
-def validate_chapter_xml(xml_content: str) -> dict:
+def validate_chapter_xml(xml_content: str) -> ChapterXmlValidation:
     """
     Basic validation of generated chapter XML.
 
+    The XML is parsed once and checked on the element tree, so a chapter counts as
+    complete only if it has its own num and heading. Namespaced documents (e.g. a
+    full akomaNtoso file) are matched by local element name.
+
     Args:
         xml_content: Generated XML string
 
     Returns:
-        Dictionary with validation results
+        ChapterXmlValidation with the results (is_well_formed is False if parsing fails)
     """
-    validation = {
-        "has_body": "<body>" in xml_content,
-        "has_chapters": "<chapter" in xml_content,
-        "chapter_count": xml_content.count("<chapter"),
-        "has_headings": "<heading>" in xml_content,
-        "has_nums": "<num>" in xml_content,
-        "is_well_formed": True  # Basic check
-    }
-
-    # Check if all chapters have required elements
-    chapter_count = validation["chapter_count"]
-    heading_count = xml_content.count("<heading>")
-    num_count = xml_content.count("<num>")
-
-    validation["all_chapters_complete"] = (
-        chapter_count == heading_count == num_count
+    try:
+        root = ET.fromstring(xml_content)
+    except ET.ParseError:
+        # Not parseable: fall back to substring checks so the report still says what is there
+        return ChapterXmlValidation(
+            has_body="<body>" in xml_content,
+            has_chapters="<chapter" in xml_content,
+            chapter_count=xml_content.count("<chapter"),
+            has_headings="<heading>" in xml_content,
+            has_nums="<num>" in xml_content,
+            is_well_formed=False,
+            all_chapters_complete=False
+        )
+
+    local_names = set()
+    chapters = []
+    for element in root.iter():
+        name = element.tag.rsplit('}', 1)[-1]
+        local_names.add(name)
+        if name == "chapter":
+            chapters.append(element)
+
+    def is_complete(chapter) -> bool:
+        child_names = {child.tag.rsplit('}', 1)[-1] for child in chapter}
+        return "num" in child_names and "heading" in child_names
+
+    return ChapterXmlValidation(
+        has_body="body" in local_names,
+        has_chapters=bool(chapters),
+        chapter_count=len(chapters),
+        has_headings="heading" in local_names,
+        has_nums="num" in local_names,
+        is_well_formed=True,
+        all_chapters_complete=all(is_complete(chapter) for chapter in chapters)
     )
 
-    return validation
-
 def build_chapters_with_sections_xml(chapters: List[ChapterInfo], sections: List[SectionInfo]) -> str:
     """
     Build Akoma Ntoso XML structure for chapters with sections nested inside.
@@ -116,7 +157,7 @@ def build_chapters_with_sections_xml(chapters: List[ChapterInfo], sections: List
         return "    <body>\n      <!-- No chapters found -->\n    </body>"
 
     # Sort chapters and group sections by chapter
-    sorted_chapters = sorted(chapters, key=lambda ch: ch.start_line)
+    sorted_chapters = sorted(chapters, key=attrgetter('start_line'))
     sections_by_chapter = {}
 
     for section in sections:
@@ -126,7 +167,7 @@ def build_chapters_with_sections_xml(chapters: List[ChapterInfo], sections: List
 
     # Sort sections within each chapter by start line
     for chapter_num in sections_by_chapter:
-        sections_by_chapter[chapter_num].sort(key=lambda s: s.start_line)
+        sections_by_chapter[chapter_num].sort(key=attrgetter('start_line'))
 
     xml_parts = ["    <body>"]
 
@@ -137,7 +178,7 @@ def build_chapters_with_sections_xml(chapters: List[ChapterInfo], sections: List
         xml_parts.extend([
             f'      <chapter id="{chapter_id}">',
             f'        <num>CHAPTER {chapter.chapter_number}</num>',
-            f'        <heading>{chapter.title}</heading>'
+            f'        <heading>{escape_xml(chapter.title)}</heading>'
         ])
 
         # Add sections if this chapter has any
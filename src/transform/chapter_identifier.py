@@ -1,25 +1,47 @@
 import instructor
-from openai import OpenAI
 import os
 from dotenv import load_dotenv
-from typing import List
+from operator import attrgetter
+from typing import List, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from .models import ChapterInfo, ChaptersOnPage
+from .models import ChapterInfo, ChaptersOnPage, ChaptersOnPages
 from .page_iterator import iterate_pages_with_lines
+from .llm_client import get_openai_client
+from ._llm_cache import cached_completion
 
 load_dotenv()
 
+_ROMAN_VALUES = ((1000, "M"), (900, "CM"), (500, "D"), (400, "CD"), (100, "C"), (90, "XC"),
+                 (50, "L"), (40, "XL"), (10, "X"), (9, "IX"), (5, "V"), (4, "IV"), (1, "I"))
+
+
+def int_to_roman(number: int) -> str:
+    """
+    Convert a positive integer to an uppercase Roman numeral.
+
+    Args:
+        number: Integer to convert (1 or greater)
+
+    Returns:
+        Roman numeral string, e.g. 14 -> "XIV"
+    """
+    numeral = []
+    for value, symbol in _ROMAN_VALUES:
+        count, number = divmod(number, value)
+        numeral.append(symbol * count)
+    return "".join(numeral)
+
+
+# Chapter numerals I..C and their positions, built once for sequence validation
+_ROMAN = tuple(int_to_roman(i) for i in range(1, 101))
+_ROMAN_IDX = {numeral: i for i, numeral in enumerate(_ROMAN, 1)}
+
 class ChapterIdentifier:
     """LLM-based chapter identifier for EU regulations"""
 
     def __init__(self):
         """Initialize with OpenRouter client using GPT-5"""
-        self.client = instructor.from_openai(
-            OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=os.getenv("OPENROUTER_API_KEY"),
-            )
-        )
+        self.client = instructor.from_openai(get_openai_client())
         self.model = "openai/gpt-5-mini"
 
     def identify_chapters_on_page(self, page_text: str, page_num: int) -> ChaptersOnPage:
@@ -34,7 +56,8 @@ class ChapterIdentifier:
             ChaptersOnPage with all chapters found on this page
         """
         try:
-            result = self.client.chat.completions.create(
+            result = cached_completion(
+                self.client,
                 model=self.model,
                 response_model=ChaptersOnPage,
                 messages=[
@@ -83,6 +106,76 @@ Set has_chapters to true if any chapters found, false otherwise."""
                 has_chapters=False
             )
 
+    def identify_chapters_on_page_batch(self, pages: List[Tuple[int, str]]) -> ChaptersOnPages:
+        """
+        Identify chapters on several adjacent pages with a single LLM request.
+
+        Args:
+            pages: List of (page_number, page_text_with_lines) tuples
+
+        Returns:
+            ChaptersOnPages with all chapters found on these pages
+        """
+        page_numbers = [page_num for page_num, _ in pages]
+        pages_text = "\n\n".join(
+            f"=== PAGE {page_num} ===\n{page_text}" for page_num, page_text in pages
+        )
+
+        try:
+            result = cached_completion(
+                self.client,
+                model=self.model,
+                response_model=ChaptersOnPages,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": """You are analyzing consecutive pages of an EU regulation to identify CHAPTER headings.
+
+Each page starts with a "=== PAGE n ===" marker.
+
+Look for text patterns like:
+- "CHAPTER I" followed by a title
+- "CHAPTER II" followed by a title
+- "CHAPTER III" followed by a title
+- etc.
+
+IMPORTANT:
+- Only identify CHAPTER headings with Roman numerals (I, II, III, IV, V, VI, VII, VIII, IX, X, etc.)
+- Ignore articles, sections, or other structures
+- Return exact line numbers from the numbered text provided
+- Extract the complete chapter title that follows the chapter number
+- Each chapter should have both number and title
+- Set each chapter's page_number to the page marker it appears under"""
+                    },
+                    {
+                        "role": "user",
+                        "content": f"""Find any CHAPTER headings on these pages (pages {page_numbers[0]} to {page_numbers[-1]}):
+
+{pages_text}
+
+Identify:
+- chapter_number: Roman numeral (I, II, III, etc.)
+- title: Complete chapter title
+- start_line: Exact line number where "CHAPTER" appears
+- page_number: Page the chapter appears on
+- confidence: Your confidence level (0-100)
+
+Set page_numbers to {page_numbers}.
+Set has_chapters to true if any chapters found, false otherwise."""
+                    }
+                ]
+            )
+            return result
+
+        except Exception as e:
+            print(f"Error processing pages {page_numbers[0]}-{page_numbers[-1]}: {e}")
+            print(f"API Key present: {'Yes' if os.getenv('OPENROUTER_API_KEY') else 'No'}")
+            return ChaptersOnPages(
+                page_numbers=page_numbers,
+                chapters=[],
+                has_chapters=False
+            )
+
     def extract_all_chapters(self, pdf_path: str, start_page: int = 1, end_page: int = None) -> List[ChapterInfo]:
         """
         Extract all chapters from PDF by iterating through pages sequentially.
@@ -123,7 +216,7 @@ Set has_chapters to true if any chapters found, false otherwise."""
         print(f"\nTotal: Found {len(all_chapters)} chapters across {pages_processed} pages")
         return all_chapters
 
-    def extract_all_chapters_parallel(self, pdf_path: str, start_page: int = 1, end_page: int = None, max_workers: int = 5) -> List[ChapterInfo]:
+    def extract_all_chapters_parallel(self, pdf_path: str, start_page: int = 1, end_page: int = None, max_workers: int = 5, batch_size: int = 1) -> List[ChapterInfo]:
         """
         Extract all chapters from PDF using parallel processing.
 
@@ -132,6 +225,7 @@ Set has_chapters to true if any chapters found, false otherwise."""
             start_page: Starting page number (default: 1)
             end_page: Ending page number (default: None for all pages)
             max_workers: Maximum number of parallel workers (default: 5)
+            batch_size: Pages sent per LLM request (default: 1, one request per page)
 
         Returns:
             List of all ChapterInfo found across all pages
@@ -147,45 +241,67 @@ Set has_chapters to true if any chapters found, false otherwise."""
                 break
             pages_to_process.append((page_num, page_text))
 
+        return self._identify_chapters_on_pages(pages_to_process, max_workers, batch_size)
+
+    def _identify_chapters_on_pages(self, pages_to_process: List[Tuple[int, str]], max_workers: int, batch_size: int = 1) -> List[ChapterInfo]:
+        """
+        Identify chapters on already-extracted pages using a thread pool.
+
+        Args:
+            pages_to_process: List of (page_number, page_text_with_lines) tuples
+            max_workers: Maximum number of parallel workers
+            batch_size: Pages sent per LLM request (default: 1)
+
+        Returns:
+            List of all ChapterInfo found, sorted by start line
+        """
         print(f"Found {len(pages_to_process)} pages to process")
 
         all_chapters = []
 
-        # Process pages in parallel
+        # Group adjacent pages; each group is one LLM request
+        batches = [pages_to_process[i:i + batch_size] for i in range(0, len(pages_to_process), batch_size)]
+
+        # Process page batches in parallel
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all pages for processing
-            future_to_page = {
-                executor.submit(self.identify_chapters_on_page, page_text, page_num): page_num
-                for page_num, page_text in pages_to_process
-            }
+            # Submit all batches for processing
+            future_to_label = {}
+            for batch in batches:
+                if len(batch) == 1:
+                    page_num, page_text = batch[0]
+                    future = executor.submit(self.identify_chapters_on_page, page_text, page_num)
+                    future_to_label[future] = f"Page {page_num}"
+                else:
+                    future = executor.submit(self.identify_chapters_on_page_batch, batch)
+                    future_to_label[future] = f"Pages {batch[0][0]}-{batch[-1][0]}"
 
             # Collect results as they complete
-            completed_pages = 0
-            for future in as_completed(future_to_page):
-                page_num = future_to_page[future]
-                completed_pages += 1
+            completed_batches = 0
+            for future in as_completed(future_to_label):
+                label = future_to_label[future]
+                completed_batches += 1
 
                 try:
-                    chapters_on_page = future.result()
-                    print(f"  Page {page_num} completed ({completed_pages}/{len(pages_to_process)})")
+                    chapters_found = future.result()
+                    print(f"  {label} completed ({completed_batches}/{len(batches)})")
 
-                    if chapters_on_page.has_chapters:
-                        print(f"    Found {len(chapters_on_page.chapters)} chapter(s)")
-                        for chapter in chapters_on_page.chapters:
+                    if chapters_found.has_chapters:
+                        print(f"    Found {len(chapters_found.chapters)} chapter(s)")
+                        for chapter in chapters_found.chapters:
                             print(f"      CHAPTER {chapter.chapter_number}: {chapter.title} (line {chapter.start_line})")
 
-                        all_chapters.extend(chapters_on_page.chapters)
+                        all_chapters.extend(chapters_found.chapters)
 
                 except Exception as e:
-                    print(f"    Error processing page {page_num}: {e}")
+                    print(f"    Error processing {label.lower()}: {e}")
 
         # Sort chapters by line number to maintain document order
-        all_chapters.sort(key=lambda ch: ch.start_line)
+        all_chapters.sort(key=attrgetter('start_line'))
 
         print(f"\nTotal: Found {len(all_chapters)} chapters across {len(pages_to_process)} pages")
         return all_chapters
 
-    def extract_all_chapters_auto(self, pdf_path: str, max_workers: int = 4) -> List[ChapterInfo]:
+    def extract_all_chapters_auto(self, pdf_path: str, max_workers: int = 4, batch_size: int = 1) -> List[ChapterInfo]:
         """
         Brute force extract all chapters from entire PDF document.
         Scans every page from start to end.
@@ -193,27 +309,26 @@ Set has_chapters to true if any chapters found, false otherwise."""
         Args:
             pdf_path: Path to the PDF file
             max_workers: Maximum number of parallel workers (default: 4)
+            batch_size: Pages sent per LLM request (default: 1, one request per page)
 
         Returns:
             List of all ChapterInfo found in the document
         """
         print("Brute force scanning entire document for chapters...")
 
-        # Get total pages by iterating through document
-        total_pages = 0
-        for page_num, _, _ in iterate_pages_with_lines(pdf_path):
-            total_pages = page_num
+        # Parse the document once; the page list gives the page count too
+        pages_to_process = [
+            (page_num, page_text)
+            for page_num, page_text, _ in iterate_pages_with_lines(pdf_path)
+        ]
+        total_pages = pages_to_process[-1][0] if pages_to_process else 0
 
         print(f"   Total pages in document: {total_pages}")
         print(f"   Scanning all pages from 1 to {total_pages}...")
 
         # Extract chapters from entire document
-        chapters = self.extract_all_chapters_parallel(
-            pdf_path,
-            start_page=1,
-            end_page=total_pages,
-            max_workers=max_workers
-        )
+        print(f"Processing pages 1 to {total_pages} for chapters (parallel with {max_workers} workers)...")
+        chapters = self._identify_chapters_on_pages(pages_to_process, max_workers, batch_size)
 
         if chapters:
             print(f"   Found {len(chapters)} potential chapters, filtering false positives...")
@@ -242,22 +357,22 @@ Set has_chapters to true if any chapters found, false otherwise."""
         Returns:
             Dictionary with validation results
         """
-        roman_numerals = ["I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X",
-                         "XI", "XII", "XIII", "XIV", "XV", "XVI", "XVII", "XVIII", "XIX", "XX"]
-
         chapter_numbers = [ch.chapter_number for ch in chapters]
+        total = len(chapters)
 
-        # Check if sequence is valid
-        expected_sequence = roman_numerals[:len(chapters)]
-        is_sequential = chapter_numbers == expected_sequence
+        # Compare positions as integers; numerals outside the table map to None
+        positions = [_ROMAN_IDX.get(num) for num in chapter_numbers]
+        expected_sequence = list(_ROMAN[:total])
+        is_sequential = positions == list(range(1, total + 1))
+        found = set(positions)
 
         return {
             "total_chapters": len(chapters),
             "chapter_numbers": chapter_numbers,
             "expected_sequence": expected_sequence,
             "is_sequential": is_sequential,
-            "missing_chapters": [num for num in expected_sequence if num not in chapter_numbers],
-            "unexpected_chapters": [num for num in chapter_numbers if num not in expected_sequence]
+            "missing_chapters": [num for i, num in enumerate(expected_sequence, 1) if i not in found],
+            "unexpected_chapters": [num for num, position in zip(chapter_numbers, positions) if position is None or position > total]
         }
 
     def _filter_false_positive_chapters(self, chapters: List[ChapterInfo]) -> List[ChapterInfo]:
@@ -299,7 +414,7 @@ Set has_chapters to true if any chapters found, false otherwise."""
                     print(f"     Filtered out Chapter {chapter_number} at line {chapter.start_line} (too early, likely preamble)")
             else:
                 # Multiple chapters with same number - keep the one that appears later
-                latest_chapter = max(chapter_list, key=lambda ch: ch.start_line)
+                latest_chapter = max(chapter_list, key=attrgetter('start_line'))
                 if latest_chapter.start_line >= MIN_CHAPTER_LINE:
                     filtered_chapters.append(latest_chapter)
                     print(f"     Found duplicate Chapter {chapter_number}, kept the one at line {latest_chapter.start_line}")
@@ -307,6 +422,6 @@ Set has_chapters to true if any chapters found, false otherwise."""
                     print(f"     Filtered out all instances of Chapter {chapter_number} (all too early)")
 
         # Sort by start_line
-        filtered_chapters.sort(key=lambda ch: ch.start_line)
+        filtered_chapters.sort(key=attrgetter('start_line'))
 
         return filtered_chapters
\ No newline at end of file
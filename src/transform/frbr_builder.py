@@ -1,4 +1,5 @@
 from .models import DocumentMetadata
+from .article_builder import escape_xml
 
 def build_frbr_metadata(metadata: DocumentMetadata) -> str:
     """Convert validated metadata to FRBR XML structure for Akoma Ntoso"""
@@ -34,7 +35,7 @@ def build_frbr_metadata(metadata: DocumentMetadata) -> str:
       <FRBRauthor href="#{metadata.country}"/>
       <FRBRcountry value="{metadata.country}"/>
       <FRBRnumber value="{metadata.number}"/>
-      <FRBRname value="{metadata.title}"/>
+      <FRBRname value="{escape_xml(metadata.title)}"/>
     </FRBRWork>
     <FRBRExpression>
       <FRBRthis value="{expression_uri}"/>
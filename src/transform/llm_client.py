@@ -0,0 +1,29 @@
+"""
+Shared OpenRouter client for the LLM-based extractors.
+"""
+
+import os
+from functools import lru_cache
+from openai import OpenAI
+from dotenv import load_dotenv
+
+load_dotenv()
+
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+
+@lru_cache(maxsize=None)
+def get_openai_client() -> OpenAI:
+    """
+    Get the process-wide OpenRouter client.
+
+    The client keeps a pool of open connections, so sharing one instance lets
+    successive requests reuse connections instead of repeating the TCP/TLS handshake.
+
+    Returns:
+        OpenAI client configured for OpenRouter
+    """
+    return OpenAI(
+        base_url=OPENROUTER_BASE_URL,
+        api_key=os.getenv("OPENROUTER_API_KEY"),
+    )
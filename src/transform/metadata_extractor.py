@@ -1,35 +1,16 @@
 import instructor
-from openai import OpenAI
 from typing import Dict, Any
-import os
 from dotenv import load_dotenv
 from .models import DocumentMetadata, ValidationResult
+from .llm_client import get_openai_client
 
 load_dotenv()
 
 class MetadataExtractor:
     """Multi-LLM metadata extractor with self-validation using OpenRouter and GPT-4"""
 
-    def __init__(self):
-        """Initialize with OpenRouter client using GPT-4"""
-        self.client = instructor.from_openai(
-            OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=os.getenv("OPENROUTER_API_KEY"),
-            )
-        )
-        self.extraction_model = "openai/gpt-5"
-        self.validation_model = "openai/gpt-5"
-
-    def extract_metadata(self, text: str) -> DocumentMetadata:
-        """Step 1: Extract metadata using GPT-4 with structured output"""
-        return self.client.chat.completions.create(
-            model=self.extraction_model,
-            response_model=DocumentMetadata,
-            messages=[
-                {
-                    "role": "system",
-                    "content": """Extract metadata from legal documents accurately.
+    # Prompts are built once per process; the validation prompt is filled with str.format
+    EXTRACTION_SYSTEM_PROMPT = """Extract metadata from legal documents accurately.
                     For EU documents: country should be 'eu', language typically 'eng'.
                     Document types: regulation, act, directive, implementing regulation, delegated regulation.
                     Parse dates carefully (format as YYYY-MM-DD).
@@ -37,21 +18,14 @@ class MetadataExtractor:
                     IMPORTANT for title field: Extract the COMPLETE title including the document type and number.
                     For example: "Regulation (EU) 2022/2554 on digital operational resilience..."
                     NOT just: "on digital operational resilience..." """
-                },
-                {
-                    "role": "user",
-                    "content": f"Extract metadata from this legal document:\n\n{text[:2000]}"
-                }
-            ]
-        )
 
-    def validate_metadata(self, text: str, metadata: DocumentMetadata) -> ValidationResult:
-        """Step 2: Validate extracted metadata with GPT-4"""
-        validation_prompt = f"""
+    VALIDATION_SYSTEM_PROMPT = "Validate metadata extraction accuracy. Be strict and provide corrections if anything is wrong."
+
+    VALIDATION_PROMPT_TEMPLATE = """
         Verify if this metadata extraction is correct by checking against the original text.
 
         Original text excerpt:
-        {text[:1500]}
+        {text_excerpt}
 
         Extracted metadata:
         - Document Type: {metadata.document_type}
@@ -66,13 +40,40 @@ class MetadataExtractor:
         Give confidence score based on how certain you are.
         """
 
+    def __init__(self):
+        """Initialize with OpenRouter client using GPT-4"""
+        self.client = instructor.from_openai(get_openai_client())
+        self.extraction_model = "openai/gpt-5"
+        self.validation_model = "openai/gpt-5"
+
+    def extract_metadata(self, text: str) -> DocumentMetadata:
+        """Step 1: Extract metadata using GPT-4 with structured output"""
+        return self.client.chat.completions.create(
+            model=self.extraction_model,
+            response_model=DocumentMetadata,
+            messages=[
+                {
+                    "role": "system",
+                    "content": self.EXTRACTION_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": f"Extract metadata from this legal document:\n\n{text[:2000]}"
+                }
+            ]
+        )
+
+    def validate_metadata(self, text: str, metadata: DocumentMetadata) -> ValidationResult:
+        """Step 2: Validate extracted metadata with GPT-4"""
+        validation_prompt = self.VALIDATION_PROMPT_TEMPLATE.format(text_excerpt=text[:1500], metadata=metadata)
+
         return self.client.chat.completions.create(
             model=self.validation_model,
             response_model=ValidationResult,
             messages=[
                 {
                     "role": "system",
-                    "content": "Validate metadata extraction accuracy. Be strict and provide corrections if anything is wrong."
+                    "content": self.VALIDATION_SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
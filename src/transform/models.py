@@ -60,6 +60,12 @@ class ChaptersOnPage(BaseModel):
     chapters: List[ChapterInfo] = Field(default_factory=list, description="Chapters found on this page")
     has_chapters: bool = Field(description="Whether any chapters were found")
 
+class ChaptersOnPages(BaseModel):
+    """All chapters found on a batch of adjacent pages"""
+    page_numbers: List[int] = Field(description="Page numbers covered by this batch")
+    chapters: List[ChapterInfo] = Field(default_factory=list, description="Chapters found on these pages, each with its own page_number")
+    has_chapters: bool = Field(description="Whether any chapters were found")
+
 class ArticleInfo(BaseModel):
     """Single article found in document"""
     article_number: int = Field(description="Article number: 1, 2, 3, etc.")
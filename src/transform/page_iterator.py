@@ -1,5 +1,6 @@
 import pdfplumber
 from typing import Generator, Tuple
+from ..pdf_extractor import extract_page_texts_parallel
 
 def iterate_pages_with_lines(pdf_path: str) -> Generator[Tuple[int, str, int], None, None]:
     """
@@ -19,6 +20,9 @@ def iterate_pages_with_lines(pdf_path: str) -> Generator[Tuple[int, str, int], N
     with pdfplumber.open(pdf_path) as pdf:
         for page_num, page in enumerate(pdf.pages, 1):
             page_text = page.extract_text()
+            # Only the text is kept, so drop the page's parsed layout objects now
+            # rather than holding every page's until the document is closed
+            page.close()
 
             if page_text:
                 # Split into lines and add line numbers
@@ -34,6 +38,32 @@ def iterate_pages_with_lines(pdf_path: str) -> Generator[Tuple[int, str, int], N
                     page_with_lines = '\n'.join(numbered_lines)
                     yield page_num, page_with_lines, global_line_number - len(numbered_lines)
 
+def iterate_pages_with_lines_parallel(pdf_path: str, max_workers: int = None) -> Generator[Tuple[int, str, int], None, None]:
+    """
+    Same output as iterate_pages_with_lines(), with page text extracted by worker processes.
+
+    Pages are parsed in parallel up front; line numbers and offsets are then assigned
+    in page order.
+
+    Args:
+        pdf_path: Path to the PDF file
+        max_workers: Number of worker processes (defaults to the CPU count)
+
+    Yields:
+        tuple: (page_number, page_text_with_lines, global_line_offset)
+    """
+    global_line_number = 1
+
+    for page_num, page_text in enumerate(extract_page_texts_parallel(pdf_path, max_workers), 1):
+        numbered_lines = []
+        for line in page_text.split('\n'):
+            if line.strip():  # Only add non-empty lines
+                numbered_lines.append(f"{global_line_number:4d}: {line}")
+                global_line_number += 1
+
+        if numbered_lines:  # Only yield if page has content
+            yield page_num, '\n'.join(numbered_lines), global_line_number - len(numbered_lines)
+
 def get_page_range(pdf_path: str, start_page: int = 1, end_page: int = None) -> Generator[Tuple[int, str, int], None, None]:
     """
     Get a specific range of pages from PDF.
@@ -9,8 +9,60 @@ Handles complex paragraph structures found in EU legal documents:
 """
 
 import re
+import string
+import sys
 from typing import List, Optional, Tuple
 from .models import ParagraphInfo
+from ._regex import compile_pattern
+
+# Line patterns, compiled once at import rather than looked up per line (RE2 when installed)
+_LETTERED_RE = compile_pattern(r'^\(([a-z])\)\s+(.+)')
+_ROMAN_RE = compile_pattern(r'^\(([ivx]+)\)\s+(.+)')
+_STRUCTURE_START_RE = compile_pattern(r'^(?:\([a-z]\)|\([ivx]+\)|\d+\.|\(\d+\))\s+')
+
+# Numbered paragraph "1. text" or "(1) text", both forms in one match
+_PARAGRAPH_RE = compile_pattern(r'^(?:(?P<number>\d+)\.|\((?P<paren_number>\d+)\))\s+(?P<text>.+)')
+
+# Classify the line after a paragraph (or (a) sub-paragraph) with a single match:
+# "sub" opens a nested item, "stop" starts a sibling or parent item and
+# "bracketed" is other parenthesised text, which is skipped. Alternatives are
+# tried in that order, so lastgroup gives the first rule that applies.
+_AFTER_PARAGRAPH_RE = compile_pattern(
+    r'(?P<sub>\([a-z]\)\s+.)'
+    r'|(?P<stop>(?:\d+\.|\(\d+\))\s+)'
+    r'|(?P<bracketed>\(.*\))'
+)
+_AFTER_SUB_PARAGRAPH_RE = compile_pattern(
+    r'(?P<sub>\([ivx]+\)\s+.)'
+    r'|(?P<stop>(?:\([a-z]\)|\d+\.|\(\d+\))\s+)'
+    r'|(?P<bracketed>\(.*\))'
+)
+
+# Sub-point numerals (i) to (xxx), looked up directly instead of parsed per call
+_ROMAN_TO_INT = {numeral: value for value, numeral in enumerate((
+    'i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+    'xi', 'xii', 'xiii', 'xiv', 'xv', 'xvi', 'xvii', 'xviii', 'xix', 'xx',
+    'xxi', 'xxii', 'xxiii', 'xxiv', 'xxv', 'xxvi', 'xxvii', 'xxviii', 'xxix', 'xxx',
+), 1)}
+
+# Shared "(a)".."(z)" and "(i)".."(xxx)" numbers, so sub-paragraphs reuse one string each
+_SUB_PARAGRAPH_NUMBERS = {
+    marker: sys.intern(f"({marker})") for marker in (*string.ascii_lowercase, *_ROMAN_TO_INT)
+}
+
+# Page references and document metadata, as one alternation
+_SKIP_LINE_RE = compile_pattern('|'.join([
+    r'ELI:\s*http',
+    r'\d+/\d+\s*$',  # Page numbers like "7/29"
+    r'^EN\s*$',
+    r'^OJ\s+L,',
+    r'^\(\d+\)\s+Regulation \(EU\)',  # References to other regulations
+    r'^\(\d+\)\s+Directive \(EU\)',   # References to other directives
+]))
+
+# Every skip pattern needs one of these literals, so lines without them skip the regex
+_SKIP_LINE_SUBSTRINGS = ('/', 'ELI:')
+_SKIP_LINE_PREFIXES = ('EN', 'OJ', '(')
 
 
 class ParagraphExtractor:
@@ -43,6 +95,12 @@ class ParagraphExtractor:
         if not lines:
             return []
 
+        # Numbered paragraphs start with a digit or "(" (cleaned lines are stripped and
+        # non-empty). Without such a line the content is a single introductory
+        # paragraph, so skip the per-line pattern matching.
+        if not any(line[0] == '(' or line[0].isdecimal() for line in lines):
+            return [ParagraphInfo.model_construct(content=' '.join(lines), level=1, is_introductory=True)]
+
         # Extract paragraphs using hierarchical approach
         paragraphs = self._extract_hierarchical_paragraphs(lines)
 
@@ -98,18 +156,9 @@ class ParagraphExtractor:
         if not line:
             return False
 
-        # Skip page references and document metadata
-        skip_patterns = [
-            r'ELI:\s*http',
-            r'\d+/\d+\s*$',  # Page numbers like "7/29"
-            r'^EN\s*$',
-            r'^OJ\s+L,',
-            r'^\(\d+\)\s+Regulation \(EU\)',  # References to other regulations
-            r'^\(\d+\)\s+Directive \(EU\)',   # References to other directives
-        ]
-
-        for pattern in skip_patterns:
-            if re.search(pattern, line):
+        # Skip page references and document metadata (literal prefilter first)
+        if line.startswith(_SKIP_LINE_PREFIXES) or any(literal in line for literal in _SKIP_LINE_SUBSTRINGS):
+            if _SKIP_LINE_RE.search(line):
                 return False
 
         return True
@@ -118,6 +167,9 @@ class ParagraphExtractor:
         """
         Extract paragraphs with hierarchical structure.
 
+        Paragraphs are built with model_construct: every field is a regex group,
+        joined text or a fixed level, so pydantic validation would only add cost.
+
         Args:
             lines: Cleaned content lines
 
@@ -135,13 +187,12 @@ class ParagraphExtractor:
             line = lines[i].strip()
 
             # Check for numbered paragraph (1., 2., 3.) or ((1), (2), (3))
-            numbered_match = re.match(r'^(\d+)\.\s+(.+)', line)
-            numbered_paren_match = re.match(r'^\((\d+)\)\s+(.+)', line)
+            paragraph_match = _PARAGRAPH_RE.match(line)
 
-            if numbered_match or numbered_paren_match:
+            if paragraph_match:
                 # Save any accumulated introductory text
                 if current_text:
-                    intro_para = ParagraphInfo(
+                    intro_para = ParagraphInfo.model_construct(
                         content=' '.join(current_text),
                         level=1,
                         is_introductory=True
@@ -150,14 +201,11 @@ class ParagraphExtractor:
                     current_text = []
 
                 # Extract numbered paragraph with potential sub-paragraphs
-                if numbered_match:
-                    para_num = numbered_match.group(1)
-                    para_content = numbered_match.group(2)
-                    para_display_num = para_num  # Display as "1", "2", etc.
-                else:  # numbered_paren_match
-                    para_num = numbered_paren_match.group(1)
-                    para_content = numbered_paren_match.group(2)
-                    para_display_num = f"({para_num})"  # Display as "(1)", "(2)", etc.
+                para_content = paragraph_match.group('text')
+                if paragraph_match.group('number') is not None:
+                    para_display_num = paragraph_match.group('number')  # Display as "1", "2", etc.
+                else:
+                    para_display_num = f"({paragraph_match.group('paren_number')})"  # Display as "(1)", "(2)", etc.
 
                 # Look ahead for continuation and sub-paragraphs
                 para_lines = [para_content]
@@ -166,10 +214,11 @@ class ParagraphExtractor:
 
                 while i < len(lines):
                     next_line = lines[i].strip()
+                    line_match = _AFTER_PARAGRAPH_RE.match(next_line)
+                    kind = line_match.lastgroup if line_match else None
 
                     # Check if this is a sub-paragraph (a), (b), (c)
-                    letter_match = re.match(r'^\(([a-z])\)\s+(.+)', next_line)
-                    if letter_match:
+                    if kind == 'sub':
                         sub_para = self._extract_sub_paragraph(lines, i, level=2)
                         if sub_para:
                             sub_paragraphs.append(sub_para[0])
@@ -177,17 +226,17 @@ class ParagraphExtractor:
                         else:
                             i += 1
                     # Check if this is start of next numbered paragraph
-                    elif re.match(r'^\d+\.\s+', next_line) or re.match(r'^\(\d+\)\s+', next_line):
+                    elif kind == 'stop':
                         break
                     # Check if this is continuation of current paragraph
-                    elif not re.match(r'^\(.*\)', next_line) and next_line:
+                    elif kind is None and next_line:
                         para_lines.append(next_line)
                         i += 1
                     else:
                         i += 1
 
                 # Create paragraph
-                paragraph = ParagraphInfo(
+                paragraph = ParagraphInfo.model_construct(
                     paragraph_number=para_display_num,
                     content=' '.join(para_lines),
                     level=1,
@@ -204,7 +253,7 @@ class ParagraphExtractor:
 
         # Handle any remaining text as introductory paragraph
         if current_text:
-            intro_para = ParagraphInfo(
+            intro_para = ParagraphInfo.model_construct(
                 content=' '.join(current_text),
                 level=1,
                 is_introductory=True
@@ -233,10 +282,10 @@ class ParagraphExtractor:
         # Determine pattern based on level
         if level == 2:
             # Level 2: (a), (b), (c)
-            match = re.match(r'^\(([a-z])\)\s+(.+)', line)
+            match = _LETTERED_RE.match(line)
         else:
             # Level 3: (i), (ii), (iii)
-            match = re.match(r'^\(([ivx]+)\)\s+(.+)', line)
+            match = _ROMAN_RE.match(line)
 
         if not match:
             return None
@@ -253,33 +302,29 @@ class ParagraphExtractor:
             next_line = lines[i].strip()
 
             if level == 2:
+                line_match = _AFTER_SUB_PARAGRAPH_RE.match(next_line)
+                kind = line_match.lastgroup if line_match else None
+
                 # At level 2, look for level 3 sub-paragraphs (i), (ii)
-                roman_match = re.match(r'^\(([ivx]+)\)\s+(.+)', next_line)
-                if roman_match:
+                if kind == 'sub':
                     sub_para = self._extract_sub_paragraph(lines, i, level=3)
                     if sub_para:
                         sub_paragraphs.append(sub_para[0])
                         i = sub_para[1]
                     else:
                         i += 1
-                # Check for next letter paragraph
-                elif re.match(r'^\(([a-z])\)\s+', next_line):
-                    break
-                # Check for numbered paragraph
-                elif re.match(r'^\d+\.\s+', next_line) or re.match(r'^\(\d+\)\s+', next_line):
+                # Check for next letter paragraph or numbered paragraph
+                elif kind == 'stop':
                     break
                 # Continuation text
-                elif next_line and not re.match(r'^\(.*\)', next_line):
+                elif next_line and kind is None:
                     para_lines.append(next_line)
                     i += 1
                 else:
                     i += 1
             else:
                 # At level 3, just accumulate until next structure
-                if (re.match(r'^\(([a-z])\)\s+', next_line) or
-                    re.match(r'^\(([ivx]+)\)\s+', next_line) or
-                    re.match(r'^\d+\.\s+', next_line) or
-                    re.match(r'^\(\d+\)\s+', next_line)):
+                if _STRUCTURE_START_RE.match(next_line):
                     break
                 elif next_line:
                     para_lines.append(next_line)
@@ -287,8 +332,8 @@ class ParagraphExtractor:
                 else:
                     i += 1
 
-        paragraph = ParagraphInfo(
-            paragraph_number=f"({para_id})",
+        paragraph = ParagraphInfo.model_construct(
+            paragraph_number=_SUB_PARAGRAPH_NUMBERS.get(para_id) or f"({para_id})",
             content=' '.join(para_lines),
             level=level,
             sub_paragraphs=sub_paragraphs
@@ -298,6 +343,11 @@ class ParagraphExtractor:
 
     def _roman_to_int(self, roman: str) -> int:
         """Convert roman numerals to integers for sorting."""
+        value = _ROMAN_TO_INT.get(roman.lower())
+        if value is not None:
+            return value
+
+        # Outside the table (non-canonical or beyond xxx): subtractive scan
         roman_values = {'i': 1, 'v': 5, 'x': 10}
         result = 0
         prev_value = 0
@@ -339,10 +389,7 @@ class ParagraphExtractor:
 
         # Count total sub-paragraphs recursively
         def count_all_paragraphs(paras):
-            count = len(paras)
-            for para in paras:
-                count += count_all_paragraphs(para.sub_paragraphs)
-            return count
+            return len(paras) + sum(count_all_paragraphs(para.sub_paragraphs) for para in paras)
 
         total_with_sub = count_all_paragraphs(paragraphs)
 
@@ -1,8 +1,8 @@
 import instructor
-from openai import OpenAI
-import os
+from typing import List, Union
 from dotenv import load_dotenv
 from .models import PreambleLocation
+from .llm_client import get_openai_client
 
 load_dotenv()
 
@@ -11,26 +11,25 @@ class PreambleIdentifier:
 
     def __init__(self):
         """Initialize with OpenRouter client using GPT-5"""
-        self.client = instructor.from_openai(
-            OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=os.getenv("OPENROUTER_API_KEY"),
-            )
-        )
+        self.client = instructor.from_openai(get_openai_client())
         self.model = "openai/gpt-5"
 
-    def identify_preamble(self, numbered_text: str) -> PreambleLocation:
+    def identify_preamble(self, numbered_text: Union[str, List[str]]) -> PreambleLocation:
         """
         Identify preamble location in numbered text from PDF.
 
         Args:
-            numbered_text: Text with line numbers from extract_text_with_line_numbers()
+            numbered_text: Text with line numbers from extract_text_with_line_numbers(),
+                or its already split numbered_lines
 
         Returns:
             PreambleLocation with exact line ranges and content
         """
-        # Take first 200 lines to find preamble
-        lines = numbered_text.split('\n')[:200]
+        # Take first 200 lines to find preamble (text is only split that far)
+        if isinstance(numbered_text, str):
+            lines = numbered_text.split('\n', 200)[:200]
+        else:
+            lines = numbered_text[:200]
         sample_text = '\n'.join(lines)
 
         return self.client.chat.completions.create(
@@ -1,5 +1,9 @@
 import re
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from .article_builder import escape_xml
+
+# Recital numbers like "(1)" at start of line or after whitespace
+_RECITAL_SPLIT_RE = re.compile(r'\n\s*\((\d+)\)\s*')
 
 def parse_recitals_text(recitals_text: str) -> List[Tuple[int, str]]:
     """
@@ -13,38 +17,33 @@ def parse_recitals_text(recitals_text: str) -> List[Tuple[int, str]]:
     """
     recitals = []
 
-    # Split by recital pattern (1), (2), etc.
-    # Look for pattern like "(number)" at start of line or after whitespace
-    recital_pattern = r'\n\s*\((\d+)\)\s*'
-
-    # Split the text by recital numbers
-    parts = re.split(recital_pattern, recitals_text)
-
-    # Skip first part (before first recital) and process pairs
-    for i in range(1, len(parts), 2):
-        if i + 1 < len(parts):
-            recital_num = int(parts[i])
-            recital_content = parts[i + 1].strip()
+    # Locate every recital number (1), (2), etc. in one pass; each recital's
+    # content runs up to the next number (text before the first is skipped)
+    matches = list(_RECITAL_SPLIT_RE.finditer(recitals_text))
+    ends = [match.start() for match in matches[1:]] + [len(recitals_text)]
 
-            # Clean up content - remove extra whitespace and line breaks
-            recital_content = ' '.join(recital_content.split())
+    for match, end in zip(matches, ends):
+        # Clean up content - remove extra whitespace and line breaks
+        recital_content = ' '.join(recitals_text[match.end():end].split())
 
-            if recital_content:  # Only add non-empty recitals
-                recitals.append((recital_num, recital_content))
+        if recital_content:  # Only add non-empty recitals
+            recitals.append((int(match.group(1)), recital_content))
 
     return recitals
 
-def build_recitals_xml(recitals_text: str) -> str:
+def build_recitals_xml(recitals_text: str, recitals: Optional[List[Tuple[int, str]]] = None) -> str:
     """
     Build Akoma Ntoso XML structure for recitals.
 
     Args:
         recitals_text: Raw text containing all recitals
+        recitals: Result of parse_recitals_text(recitals_text), if already parsed
 
     Returns:
         XML string with proper recitals structure
     """
-    recitals = parse_recitals_text(recitals_text)
+    if recitals is None:
+        recitals = parse_recitals_text(recitals_text)
 
     if not recitals:
         return "    <preamble>\n      <!-- No recitals found -->\n    </preamble>"
@@ -55,7 +54,7 @@ def build_recitals_xml(recitals_text: str) -> str:
         xml_parts.extend([
             f'        <recital id="rec_{recital_num}">',
             f'          <num>({recital_num})</num>',
-            f'          <p>{content}</p>',
+            f'          <p>{escape_xml(content)}</p>',
             '        </recital>'
         ])
 
@@ -63,17 +62,19 @@ def build_recitals_xml(recitals_text: str) -> str:
 
     return '\n'.join(xml_parts)
 
-def get_recitals_summary(recitals_text: str) -> dict:
+def get_recitals_summary(recitals_text: str, recitals: Optional[List[Tuple[int, str]]] = None) -> dict:
     """
     Get summary statistics about the recitals.
 
     Args:
         recitals_text: Raw text containing all recitals
+        recitals: Result of parse_recitals_text(recitals_text), if already parsed
 
     Returns:
         Dictionary with summary statistics
     """
-    recitals = parse_recitals_text(recitals_text)
+    if recitals is None:
+        recitals = parse_recitals_text(recitals_text)
 
     if not recitals:
         return {
@@ -84,11 +85,12 @@ def get_recitals_summary(recitals_text: str) -> dict:
         }
 
     numbers = [num for num, _ in recitals]
+    total_characters = sum(len(content) for _, content in recitals)
 
     return {
         "count": len(recitals),
         "first_number": min(numbers),
         "last_number": max(numbers),
-        "total_characters": sum(len(content) for _, content in recitals),
-        "average_length": sum(len(content) for _, content in recitals) // len(recitals)
-    }
\ No newline at end of file
+        "total_characters": total_characters,
+        "average_length": total_characters // len(recitals)
+    }
@@ -1,8 +1,8 @@
 import instructor
-from openai import OpenAI
-import os
+from typing import List, Union
 from dotenv import load_dotenv
 from .models import RecitalsLocation
+from .llm_client import get_openai_client
 
 load_dotenv()
 
@@ -11,26 +11,25 @@ class RecitalsIdentifier:
 
     def __init__(self):
         """Initialize with OpenRouter client using GPT-5"""
-        self.client = instructor.from_openai(
-            OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=os.getenv("OPENROUTER_API_KEY"),
-            )
-        )
+        self.client = instructor.from_openai(get_openai_client())
         self.model = "openai/gpt-5"
 
-    def identify_recitals(self, numbered_text: str) -> RecitalsLocation:
+    def identify_recitals(self, numbered_text: Union[str, List[str]]) -> RecitalsLocation:
         """
         Identify recitals location in numbered text from PDF.
 
         Args:
-            numbered_text: Text with line numbers from extract_text_with_line_numbers()
+            numbered_text: Text with line numbers from extract_text_with_line_numbers(),
+                or its already split numbered_lines
 
         Returns:
             RecitalsLocation with exact line ranges and metadata
         """
         # Take lines 15-200 to find recitals section (after preamble)
-        lines = numbered_text.split('\n')
+        if isinstance(numbered_text, str):
+            lines = numbered_text.split('\n', 200)
+        else:
+            lines = numbered_text
         # Start from line 15 to skip preamble, take up to line 200 to find recitals boundaries
         sample_lines = lines[14:200]  # Lines 15-200
         sample_text = '\n'.join(sample_lines)
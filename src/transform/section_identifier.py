@@ -1,15 +1,18 @@
 import re
+from operator import attrgetter
 from typing import List
 from .models import SectionInfo, ChapterInfo
 from ..pdf_extractor import extract_lines_range
 
+_SECTION_RE = re.compile(r'^Section ([IVX]+)', re.MULTILINE)
+
 
 class SectionIdentifier:
     """Simple section identifier for EU regulations"""
 
     def __init__(self):
-        """Initialize with regex pattern for sections"""
-        self.section_pattern = re.compile(r'^Section ([IVX]+)', re.MULTILINE)
+        """Initialize with the module's precompiled section pattern"""
+        self.section_pattern = _SECTION_RE
 
     def extract_sections_within_chapters(self, pdf_path: str, chapters: List[ChapterInfo]) -> List[SectionInfo]:
         """
@@ -29,7 +32,7 @@ class SectionIdentifier:
         print(f"Extracting sections within {len(chapters)} chapters...")
 
         # Sort chapters by start_line to determine boundaries
-        sorted_chapters = sorted(chapters, key=lambda ch: ch.start_line)
+        sorted_chapters = sorted(chapters, key=attrgetter('start_line'))
 
         for i, chapter in enumerate(sorted_chapters):
             # Determine chapter end line
@@ -92,7 +95,8 @@ class SectionIdentifier:
                 # Calculate actual line number in document
                 actual_line = chapter_start_line + line_idx
 
-                section = SectionInfo(
+                # Values come straight from the regex match, so no validation is needed
+                section = SectionInfo.model_construct(
                     section_number=section_number,
                     parent_chapter=parent_chapter,
                     start_line=actual_line,
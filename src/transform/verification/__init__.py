@@ -2,5 +2,6 @@
 from .base_verifier import BaseVerifier
 from .chapter_verifier import ChapterVerifier
 from .section_verifier import SectionVerifier
+from .interval_index import ChapterIntervalIndex
 
-__all__ = ['BaseVerifier', 'ChapterVerifier', 'SectionVerifier']
\ No newline at end of file
+__all__ = ['BaseVerifier', 'ChapterVerifier', 'SectionVerifier', 'ChapterIntervalIndex']
\ No newline at end of file
@@ -29,10 +29,10 @@ class BaseVerifier(ABC):
         from ...pdf_extractor import extract_text_with_line_numbers
 
         try:
-            pdf_text, _ = extract_text_with_line_numbers(self.pdf_path)
+            _, _, numbered_lines = extract_text_with_line_numbers(self.pdf_path)
 
             # Parse line-numbered text
-            for line in pdf_text.split('\n'):
+            for line in numbered_lines:
                 if ': ' in line:
                     parts = line.split(': ', 1)
                     try:
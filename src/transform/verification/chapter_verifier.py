@@ -2,6 +2,7 @@
 Chapter verifier for validating extracted chapters against PDF source.
 """
 
+from operator import attrgetter
 from typing import Dict, List, Any, Optional
 from .base_verifier import BaseVerifier
 from ..models import ChapterInfo
@@ -148,7 +149,7 @@ class ChapterVerifier(BaseVerifier):
             Chapter sequence analysis
         """
         # Sort by start line
-        sorted_chapters = sorted(chapters, key=lambda c: c.start_line)
+        sorted_chapters = sorted(chapters, key=attrgetter('start_line'))
 
         # Check sequence
         roman_numerals = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X', 'XI', 'XII']
@@ -0,0 +1,52 @@
+"""
+Chapter line ranges for section boundary checks.
+
+Chapters partition the document into contiguous, non-overlapping line ranges
+(each chapter runs until the line before the next chapter starts). The ranges are
+computed once from the chapter list and looked up by chapter number.
+"""
+
+from operator import attrgetter
+from typing import Dict, List, Tuple
+from ..models import ChapterInfo
+
+# Upper bound used for the last chapter, which runs to the end of the document
+OPEN_END_LINE = 999999
+
+
+class ChapterIntervalIndex:
+    """Line range of each chapter, keyed by chapter number"""
+
+    def __init__(self, chapters: List[ChapterInfo]):
+        """
+        Build the ranges from a list of chapters.
+
+        If two chapters share a number, the later one (by start line) wins.
+
+        Args:
+            chapters: List of ChapterInfo objects (any order)
+        """
+        sorted_chapters = sorted(chapters, key=attrgetter('start_line'))
+
+        self._bounds: Dict[str, Tuple[int, int]] = {}
+
+        for i, chapter in enumerate(sorted_chapters):
+            start_line = chapter.start_line
+            end_line = sorted_chapters[i + 1].start_line - 1 if i + 1 < len(sorted_chapters) else OPEN_END_LINE
+            self._bounds[chapter.chapter_number] = (start_line, end_line)
+
+    def __len__(self) -> int:
+        return len(self._bounds)
+
+    def bounds(self, chapter_number: str, default: Tuple[int, int] = (0, OPEN_END_LINE)) -> Tuple[int, int]:
+        """
+        Get the line range of a chapter by its number.
+
+        Args:
+            chapter_number: Roman numeral of the chapter
+            default: Range returned when the chapter is not indexed
+
+        Returns:
+            Tuple of (start_line, end_line)
+        """
+        return self._bounds.get(chapter_number, default)
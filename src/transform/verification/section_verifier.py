@@ -2,17 +2,37 @@
 Section verifier for validating extracted sections against PDF source.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import Dict, List, Any, Optional
 from .base_verifier import BaseVerifier
+from .interval_index import ChapterIntervalIndex
 from ..models import SectionInfo, ChapterInfo
 
+# Expected section numbering within a chapter
+_ROMAN = ('I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X')
+
 
 class SectionVerifier(BaseVerifier):
     """Verifier for section extraction accuracy"""
 
-    def __init__(self, pdf_path: str):
-        """Initialize section verifier"""
+    # Sections verified between early-exit checks in fast mode
+    FAST_CHECK_INTERVAL = 10
+
+    def __init__(self, pdf_path: str, max_workers: int = 1, fast: bool = False, fast_threshold: float = 85.0):
+        """
+        Initialize section verifier.
+
+        Args:
+            pdf_path: Path to the PDF file
+            max_workers: Number of threads used to verify sections (1 = sequential)
+            fast: Stop verifying once accuracy is guaranteed to stay above fast_threshold
+            fast_threshold: Accuracy percentage the guaranteed lower bound must exceed in fast mode
+        """
         super().__init__(pdf_path)
+        self.max_workers = max_workers
+        self.fast = fast
+        self.fast_threshold = fast_threshold
 
     def verify_component(self, section: SectionInfo) -> Dict[str, Any]:
         """
@@ -76,17 +96,22 @@ class SectionVerifier(BaseVerifier):
         report = self.generate_base_metadata("sections")
 
         # Verify each section
-        verification_results = []
-        for section in sections:
-            section_result = self.verify_component(section)
-            verification_results.append(section_result)
+        if self.fast:
+            verification_results = self._verify_sections_fast(sections)
+        else:
+            verification_results = self._verify_sections(sections)
 
-        # Calculate accuracy metrics
-        accuracy_metrics = self.calculate_accuracy_metrics(verification_results)
+        # Calculate accuracy metrics over verified sections; fast-mode skips are reported separately
+        verified_results = [r for r in verification_results if r["verification_status"] != "SKIPPED_HIGH_CONFIDENCE"]
+        skipped = len(verification_results) - len(verified_results)
+        accuracy_metrics = self.calculate_accuracy_metrics(verified_results)
+
+        # Group sections by chapter once for both analyses
+        sections_by_chapter = self._group_sections_by_chapter(sections)
 
         # Add section-specific analysis
-        section_analysis = self._analyze_section_structure(sections, chapters)
-        boundary_analysis = self._analyze_section_boundaries(sections, chapters) if chapters else {}
+        section_analysis = self._analyze_section_structure(sections, sections_by_chapter)
+        boundary_analysis = self._analyze_section_boundaries(sections, chapters, sections_by_chapter) if chapters else {}
 
         # Compile final report
         report.update({
@@ -95,143 +120,249 @@ class SectionVerifier(BaseVerifier):
             "section_analysis": section_analysis,
             "boundary_analysis": boundary_analysis,
             "summary": {
-                "total_sections_verified": len(verification_results),
+                "total_sections_verified": len(verified_results),
                 "successful_verifications": accuracy_metrics["exact_matches"],
-                "failed_verifications": len(verification_results) - accuracy_metrics["exact_matches"],
+                "failed_verifications": len(verified_results) - accuracy_metrics["exact_matches"],
                 "overall_accuracy": accuracy_metrics["accuracy_percentage"],
                 "recommendation": self._get_recommendation(accuracy_metrics["accuracy_percentage"])
             }
         })
 
+        if skipped:
+            # Accuracy if every skipped section had failed
+            report["summary"]["skipped_verifications"] = skipped
+            report["summary"]["accuracy_lower_bound"] = accuracy_metrics["exact_matches"] / len(verification_results) * 100
+
         return report
 
-    def _analyze_section_structure(self, sections: List[SectionInfo], chapters: List[ChapterInfo] = None) -> Dict[str, Any]:
+    def _verify_sections(self, sections: List[SectionInfo]) -> List[Dict[str, Any]]:
+        """
+        Verify sections, on a thread pool when max_workers > 1.
+
+        Args:
+            sections: List of sections
+
+        Returns:
+            Verification results in section order
+        """
+        # PDF lines are preloaded, so workers share no PDF handle
+        if self.max_workers > 1 and len(sections) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                return list(executor.map(self.verify_component, sections))
+
+        return [self.verify_component(section) for section in sections]
+
+    def _verify_sections_fast(self, sections: List[SectionInfo]) -> List[Dict[str, Any]]:
+        """
+        Verify sections in chunks, stopping once the remaining sections cannot pull
+        accuracy down to fast_threshold even if all of them fail.
+
+        Args:
+            sections: List of sections
+
+        Returns:
+            Verification results in section order; unverified sections are marked
+            SKIPPED_HIGH_CONFIDENCE and left out of the accuracy metrics
+        """
+        total = len(sections)
+        verification_results = []
+        matches = 0
+
+        for start in range(0, total, self.FAST_CHECK_INTERVAL):
+            end = start + self.FAST_CHECK_INTERVAL
+            chunk_results = self._verify_sections(sections[start:end])
+            verification_results.extend(chunk_results)
+            matches += sum(1 for r in chunk_results if r["exact_match"])
+
+            # Worst case: every remaining section fails
+            if end < total and matches / total * 100 > self.fast_threshold:
+                verification_results.extend(self._skipped_result(section) for section in sections[end:])
+                break
+
+        return verification_results
+
+    def _skipped_result(self, section: SectionInfo) -> Dict[str, Any]:
+        """
+        Build the result for a section not verified in fast mode.
+
+        Args:
+            section: Section that was skipped
+
+        Returns:
+            Verification result dictionary
+        """
+        return {
+            "section_number": section.section_number,
+            "parent_chapter": section.parent_chapter,
+            "reported_start_line": section.start_line,
+            "confidence_score": section.confidence,
+            "verification_details": {
+                "header_match": {
+                    "expected": f"Section {section.section_number}",
+                    "found": None,
+                    "exact_match": False,
+                    "confidence": 0.0
+                }
+            },
+            "pdf_text_at_line": None,
+            "exact_match": False,
+            "confidence": 0.0,
+            "verification_status": "SKIPPED_HIGH_CONFIDENCE",
+            "issues": []
+        }
+
+    def _analyze_section_structure(
+        self,
+        sections: List[SectionInfo],
+        sections_by_chapter: Optional[Dict[str, List[SectionInfo]]] = None
+    ) -> Dict[str, Any]:
         """
         Analyze section structure and relationships.
 
         Args:
             sections: List of sections
-            chapters: List of chapters for reference
+            sections_by_chapter: Sections grouped by chapter and sorted by start line
+                (computed if omitted)
 
         Returns:
             Section structure analysis
         """
-        # Group sections by chapter
-        sections_by_chapter = {}
-        for section in sections:
-            chapter = section.parent_chapter
-            if chapter not in sections_by_chapter:
-                sections_by_chapter[chapter] = []
-            sections_by_chapter[chapter].append(section)
-
-        # Sort sections within each chapter by start line
-        for chapter_num in sections_by_chapter:
-            sections_by_chapter[chapter_num].sort(key=lambda s: s.start_line)
+        if sections_by_chapter is None:
+            sections_by_chapter = self._group_sections_by_chapter(sections)
+        section_numbers_by_chapter = {
+            chapter: tuple(s.section_number for s in chapter_sections)
+            for chapter, chapter_sections in sections_by_chapter.items()
+        }
 
         # Analyze sequencing
         sequence_issues = []
-        for chapter_num, chapter_sections in sections_by_chapter.items():
-            section_numbers = [s.section_number for s in chapter_sections]
-
+        for chapter_num, section_numbers in section_numbers_by_chapter.items():
             # Check if sections start with "I" and follow roman numeral sequence
-            roman_numerals = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X']
-            expected_sequence = roman_numerals[:len(section_numbers)]
+            expected_sequence = _ROMAN[:len(section_numbers)]
 
             if section_numbers != expected_sequence:
                 sequence_issues.append({
                     "chapter": chapter_num,
-                    "expected": expected_sequence,
-                    "actual": section_numbers
+                    "expected": list(expected_sequence),
+                    "actual": list(section_numbers)
                 })
 
         return {
             "total_sections": len(sections),
             "chapters_with_sections": list(sections_by_chapter.keys()),
             "sections_by_chapter": {
-                chapter: [s.section_number for s in sects]
-                for chapter, sects in sections_by_chapter.items()
+                chapter: list(section_numbers)
+                for chapter, section_numbers in section_numbers_by_chapter.items()
             },
             "sections_per_chapter": {
-                chapter: len(sects) for chapter, sects in sections_by_chapter.items()
+                chapter: len(chapter_sections) for chapter, chapter_sections in sections_by_chapter.items()
             },
             "sequence_correct": len(sequence_issues) == 0,
             "sequence_issues": sequence_issues
         }
 
-    def _analyze_section_boundaries(self, sections: List[SectionInfo], chapters: List[ChapterInfo]) -> Dict[str, Any]:
+    def _group_sections_by_chapter(self, sections: List[SectionInfo]) -> Dict[str, List[SectionInfo]]:
+        """
+        Group sections by parent chapter, sorted by start line within each chapter.
+
+        Args:
+            sections: List of sections
+
+        Returns:
+            Dictionary mapping chapter number to its sorted sections
+        """
+        sections_by_chapter = {}
+        for section in sections:
+            chapter = section.parent_chapter
+            if chapter not in sections_by_chapter:
+                sections_by_chapter[chapter] = []
+            sections_by_chapter[chapter].append(section)
+
+        for chapter_num in sections_by_chapter:
+            sections_by_chapter[chapter_num].sort(key=attrgetter('start_line'))
+
+        return sections_by_chapter
+
+    def _analyze_section_boundaries(
+        self,
+        sections: List[SectionInfo],
+        chapters: List[ChapterInfo],
+        sections_by_chapter: Optional[Dict[str, List[SectionInfo]]] = None
+    ) -> Dict[str, Any]:
         """
         Analyze section boundaries within chapters.
 
         Args:
             sections: List of sections
             chapters: List of chapters
+            sections_by_chapter: Sections grouped by chapter and sorted by start line
+                (computed if omitted)
 
         Returns:
             Boundary analysis results
         """
-        # Create chapter boundary lookup
-        chapter_boundaries = {}
-        sorted_chapters = sorted(chapters, key=lambda ch: ch.start_line)
+        if sections_by_chapter is None:
+            sections_by_chapter = self._group_sections_by_chapter(sections)
 
-        for i, chapter in enumerate(sorted_chapters):
-            start_line = chapter.start_line
-            end_line = sorted_chapters[i + 1].start_line - 1 if i + 1 < len(sorted_chapters) else 999999
-            chapter_boundaries[chapter.chapter_number] = (start_line, end_line)
+        # Compute chapter line ranges once for all lookups
+        chapter_index = ChapterIntervalIndex(chapters)
 
         # Verify each section is within its parent chapter boundaries
         boundary_results = []
         for section in sections:
-            chapter_bounds = chapter_boundaries.get(section.parent_chapter, (0, 999999))
-            within_bounds = chapter_bounds[0] <= section.start_line <= chapter_bounds[1]
+            section_number = section.section_number
+            parent_chapter = section.parent_chapter
+            section_line = section.start_line
+            chapter_bounds = chapter_index.bounds(parent_chapter)
+            within_bounds = chapter_bounds[0] <= section_line <= chapter_bounds[1]
 
             result = {
-                "section_number": section.section_number,
-                "parent_chapter": section.parent_chapter,
-                "section_line": section.start_line,
+                "section_number": section_number,
+                "parent_chapter": parent_chapter,
+                "section_line": section_line,
                 "chapter_start": chapter_bounds[0],
                 "chapter_end": chapter_bounds[1],
                 "within_bounds": within_bounds
             }
 
             if not within_bounds:
-                result["issue"] = f"Section {section.section_number} at line {section.start_line} is outside Chapter {section.parent_chapter} bounds ({chapter_bounds[0]}-{chapter_bounds[1]})"
+                result["issue"] = f"Section {section_number} at line {section_line} is outside Chapter {parent_chapter} bounds ({chapter_bounds[0]}-{chapter_bounds[1]})"
 
             boundary_results.append(result)
 
         # Check for section overlaps within chapters
         overlap_issues = []
-        sections_by_chapter = {}
-        for section in sections:
-            chapter = section.parent_chapter
-            if chapter not in sections_by_chapter:
-                sections_by_chapter[chapter] = []
-            sections_by_chapter[chapter].append(section)
-
-        for chapter_num, chapter_sections in sections_by_chapter.items():
-            # Sort by start line
-            sorted_sections = sorted(chapter_sections, key=lambda s: s.start_line)
-
-            for i in range(len(sorted_sections) - 1):
-                current_section = sorted_sections[i]
-                next_section = sorted_sections[i + 1]
+        for chapter_num, sorted_sections in sections_by_chapter.items():
+            # Gaps between consecutive section starts, computed in one pass
+            starts = [s.start_line for s in sorted_sections]
+            line_gaps = [next_line - line for line, next_line in zip(starts, starts[1:])]
 
+            for i, line_gap in enumerate(line_gaps):
                 # Sections should not be too close (need some content between them)
-                line_gap = next_section.start_line - current_section.start_line
                 if line_gap < 10:  # Arbitrary minimum gap
                     overlap_issues.append({
                         "chapter": chapter_num,
-                        "section1": current_section.section_number,
-                        "section2": next_section.section_number,
-                        "line1": current_section.start_line,
-                        "line2": next_section.start_line,
+                        "section1": sorted_sections[i].section_number,
+                        "section2": sorted_sections[i + 1].section_number,
+                        "line1": starts[i],
+                        "line2": starts[i + 1],
                         "gap": line_gap
                     })
 
+        # Summarize in one pass over the results
+        within_count = 0
+        boundary_violations = []
+        for result in boundary_results:
+            if result["within_bounds"]:
+                within_count += 1
+            else:
+                boundary_violations.append(result)
+
         return {
             "boundary_checks": boundary_results,
-            "sections_within_bounds": sum(1 for r in boundary_results if r["within_bounds"]),
-            "sections_outside_bounds": sum(1 for r in boundary_results if not r["within_bounds"]),
-            "boundary_violations": [r for r in boundary_results if not r["within_bounds"]],
+            "sections_within_bounds": within_count,
+            "sections_outside_bounds": len(boundary_results) - within_count,
+            "boundary_violations": boundary_violations,
             "overlap_issues": overlap_issues,
             "total_overlap_issues": len(overlap_issues)
         }
@@ -266,27 +397,27 @@ class SectionVerifier(BaseVerifier):
         Returns:
             Hierarchy verification results
         """
+        # Bucket sections by chapter in one pass (each bucket sorted by start line)
+        sections_by_chapter = self._group_sections_by_chapter(sections)
+
         hierarchy_results = []
 
         # Check each chapter
         for chapter in chapters:
-            chapter_sections = [s for s in sections if s.parent_chapter == chapter.chapter_number]
+            chapter_sections = sections_by_chapter.get(chapter.chapter_number, [])
 
             result = {
                 "chapter_number": chapter.chapter_number,
                 "chapter_line": chapter.start_line,
                 "expected_sections": len(chapter_sections) > 0,
                 "actual_sections": len(chapter_sections),
-                "section_numbers": [s.section_number for s in sorted(chapter_sections, key=lambda x: x.start_line)]
+                "section_numbers": [s.section_number for s in chapter_sections]
             }
 
             # Validate section ordering within chapter
             if chapter_sections:
-                sorted_sections = sorted(chapter_sections, key=lambda s: s.start_line)
-                section_lines = [s.start_line for s in sorted_sections]
-
                 # Check if sections come after chapter start
-                sections_after_chapter = all(s_line > chapter.start_line for s_line in section_lines)
+                sections_after_chapter = all(s.start_line > chapter.start_line for s in chapter_sections)
                 result["sections_after_chapter_start"] = sections_after_chapter
 
                 if not sections_after_chapter:
@@ -294,10 +425,19 @@ class SectionVerifier(BaseVerifier):
 
             hierarchy_results.append(result)
 
+        # Summarize in one pass over the results
+        chapters_with_sections = 0
+        hierarchy_issues = []
+        for result in hierarchy_results:
+            if result["actual_sections"] > 0:
+                chapters_with_sections += 1
+            if result.get("issue"):
+                hierarchy_issues.append(result)
+
         return {
             "hierarchy_validation": hierarchy_results,
             "total_chapters_checked": len(chapters),
-            "chapters_with_sections": len([r for r in hierarchy_results if r["actual_sections"] > 0]),
-            "chapters_without_sections": len([r for r in hierarchy_results if r["actual_sections"] == 0]),
-            "hierarchy_issues": [r for r in hierarchy_results if r.get("issue")]
+            "chapters_with_sections": chapters_with_sections,
+            "chapters_without_sections": len(hierarchy_results) - chapters_with_sections,
+            "hierarchy_issues": hierarchy_issues
         }
\ No newline at end of file
@@ -4,25 +4,94 @@ Integration module for automatic verification in the ETL pipeline.
 
 import json
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from datetime import datetime
 from .verification import ChapterVerifier, SectionVerifier
 from .models import ChapterInfo, SectionInfo
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard library json module
+    orjson = None
+
+
+def _write_json(path: str, data: Any) -> None:
+    """
+    Write data as indented UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        path: Output file path
+        data: JSON-serializable data
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _write_json_stream(path: str, head: Dict[str, Any], items_key: str, items: Iterable[Any]) -> None:
+    """
+    Write a JSON object whose last key holds a list, serializing one list item at a time.
+
+    The output is laid out exactly like an indent=2 dump of the full object, but only
+    one item is held in serialized form at once.
+
+    Args:
+        path: Output file path
+        head: Leading keys of the object, written in order
+        items_key: Key of the trailing list
+        items: Items of the trailing list
+    """
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+    def _encode(value: Any, indent: str) -> str:
+        if orjson is not None:
+            text = orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        else:
+            text = encoder.encode(value)
+        # Encoded strings never contain raw newlines, so this only shifts layout lines
+        return text.replace('\n', '\n' + indent)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{')
+        for key, value in head.items():
+            f.write(f'\n  {encoder.encode(key)}: {_encode(value, "  ")},')
+        f.write(f'\n  {encoder.encode(items_key)}: [')
+
+        empty = True
+        for item in items:
+            f.write('\n    ' if empty else ',\n    ')
+            f.write(_encode(item, '    '))
+            empty = False
+
+        f.write(']\n}' if empty else '\n  ]\n}')
+
 
 class VerificationIntegration:
     """Handles integration of verification into the main ETL pipeline"""
 
-    def __init__(self, pdf_path: str, regulation_name: str):
+    # Accuracy thresholds (percent)
+    CRITICAL_THRESHOLD = 50  # Below this, stop pipeline
+    WARNING_THRESHOLD = 85   # Below this, show warnings but continue
+
+    def __init__(self, pdf_path: str, regulation_name: str, fast_mode: bool = False, full_report: bool = False):
         """
         Initialize verification integration.
 
         Args:
             pdf_path: Path to the PDF file
             regulation_name: Name of the regulation (for output files)
+            fast_mode: Stop section verification early once accuracy is guaranteed
+                to stay above the warning threshold
+            full_report: Always write per-item details to the verification report file,
+                even when every item passed
         """
         self.pdf_path = pdf_path
         self.regulation_name = regulation_name
+        self.fast_mode = fast_mode
+        self.full_report = full_report
         self.output_dir = "output"
 
         # Ensure output directory exists
@@ -73,37 +142,42 @@ class VerificationIntegration:
             f"{self.regulation_name}_chapter_verification.json"
         )
 
-        with open(verification_file, 'w', encoding='utf-8') as f:
-            json.dump(verification_report, f, indent=2, ensure_ascii=False)
+        _write_json(verification_file, self._report_for_file(verification_report, "chapters", accuracy))
 
         print(f"  Saved verification report: {verification_file}")
 
-        # Save enhanced chapters with verification
-        enhanced_chapters = self._enhance_chapters_with_verification(
-            chapters_with_content or self._convert_chapters_to_dict(chapters),
-            verification_report["chapters"]
-        )
+        # Save enhanced chapters with verification (caller-owned content is copied, not mutated)
+        if chapters_with_content:
+            enhanced_chapters = self._enhance_chapters_with_verification(
+                chapters_with_content,
+                verification_report["chapters"]
+            )
+        else:
+            enhanced_chapters = self._enhance_chapters_with_verification(
+                self._convert_chapters_to_dict(chapters),
+                verification_report["chapters"],
+                copy=False
+            )
 
         enhanced_file = os.path.join(
             self.output_dir,
             f"{self.regulation_name}_chapters_with_verification.json"
         )
 
-        enhanced_data = {
+        now = datetime.now()
+        enhanced_head = {
             "document": self.regulation_name,
-            "extraction_date": datetime.now().strftime("%Y-%m-%d"),
-            "extraction_timestamp": datetime.now().isoformat(),
+            "extraction_date": now.strftime("%Y-%m-%d"),
+            "extraction_timestamp": now.isoformat(),
             "verification_summary": {
                 "accuracy_percentage": accuracy,
                 "total_chapters": total_chapters,
                 "successful_verifications": successful,
                 "verification_timestamp": verification_report["verification_metadata"]["verification_timestamp"]
-            },
-            "chapters": enhanced_chapters
+            }
         }
 
-        with open(enhanced_file, 'w', encoding='utf-8') as f:
-            json.dump(enhanced_data, f, indent=2, ensure_ascii=False)
+        _write_json_stream(enhanced_file, enhanced_head, "chapters", enhanced_chapters)
 
         print(f"  Saved enhanced chapters: {enhanced_file}")
 
@@ -128,7 +202,8 @@ class VerificationIntegration:
     def _enhance_chapters_with_verification(
         self,
         chapters_data: List[Dict[str, Any]],
-        verification_results: List[Dict[str, Any]]
+        verification_results: List[Dict[str, Any]],
+        copy: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Enhance chapter data with verification results.
@@ -136,6 +211,8 @@ class VerificationIntegration:
         Args:
             chapters_data: Original chapter data
             verification_results: Verification results
+            copy: Copy each chapter dict before adding verification info. When False,
+                the dicts in chapters_data are updated in place and the same list is returned.
 
         Returns:
             Enhanced chapter data with verification info
@@ -146,9 +223,9 @@ class VerificationIntegration:
             for result in verification_results
         }
 
-        enhanced_chapters = []
+        enhanced_chapters = [] if copy else chapters_data
         for chapter in chapters_data:
-            enhanced_chapter = chapter.copy()
+            enhanced_chapter = chapter.copy() if copy else chapter
 
             # Add verification data
             chapter_num = chapter.get("chapter_number")
@@ -170,7 +247,8 @@ class VerificationIntegration:
                     "issues": ["No verification data available"]
                 }
 
-            enhanced_chapters.append(enhanced_chapter)
+            if copy:
+                enhanced_chapters.append(enhanced_chapter)
 
         return enhanced_chapters
 
@@ -241,6 +319,33 @@ RECOMMENDATION: {summary['recommendation']}
 
         return report.strip()
 
+    def _report_for_file(self, verification_report: Dict[str, Any], items_key: str, accuracy: float) -> Dict[str, Any]:
+        """
+        Get the version of a verification report to write to disk.
+
+        When every item passed and full_report is off, the per-item details are replaced
+        by a compact marker. The returned report is a shallow copy; the caller's report
+        keeps its full item list.
+
+        Args:
+            verification_report: Verification report
+            items_key: Key of the per-item results ("chapters" or "sections")
+            accuracy: Overall accuracy percentage
+
+        Returns:
+            Report to serialize
+        """
+        if self.full_report or accuracy < 100.0:
+            return verification_report
+
+        file_report = dict(verification_report)
+        file_report[items_key] = {
+            "omitted": True,
+            "reason": f"all_{items_key}_passed",
+            "count": len(verification_report[items_key])
+        }
+        return file_report
+
     def should_proceed_with_pipeline(self, verification_report: Dict[str, Any]) -> bool:
         """
         Determine if pipeline should continue based on verification results.
@@ -253,14 +358,10 @@ RECOMMENDATION: {summary['recommendation']}
         """
         accuracy = verification_report["accuracy_metrics"]["accuracy_percentage"]
 
-        # Configurable thresholds
-        critical_threshold = 50  # Below this, stop pipeline
-        warning_threshold = 85   # Below this, show warnings but continue
-
-        if accuracy < critical_threshold:
+        if accuracy < self.CRITICAL_THRESHOLD:
             print(f"\n❌ CRITICAL: Chapter accuracy ({accuracy:.1f}%) is too low. Stopping pipeline.")
             return False
-        elif accuracy < warning_threshold:
+        elif accuracy < self.WARNING_THRESHOLD:
             print(f"\n⚠️  WARNING: Chapter accuracy ({accuracy:.1f}%) is below recommended threshold.")
             print("   Continuing but manual review is recommended.")
 
@@ -284,7 +385,11 @@ RECOMMENDATION: {summary['recommendation']}
         print(f"\n--- Section Verification for {self.regulation_name} ---")
 
         # Initialize section verifier
-        section_verifier = SectionVerifier(self.pdf_path)
+        section_verifier = SectionVerifier(
+            self.pdf_path,
+            fast=self.fast_mode,
+            fast_threshold=self.WARNING_THRESHOLD
+        )
 
         # Verify sections
         verification_report = section_verifier.verify_all(sections, chapters)
@@ -302,6 +407,9 @@ RECOMMENDATION: {summary['recommendation']}
         print(f"  Total Sections: {total_sections}")
         print(f"  Successful Verifications: {successful}")
         print(f"  Accuracy: {accuracy:.1f}%")
+        if "skipped_verifications" in verification_report["summary"]:
+            print(f"  Skipped (fast mode): {verification_report['summary']['skipped_verifications']}")
+            print(f"  Accuracy Lower Bound: {verification_report['summary']['accuracy_lower_bound']:.1f}%")
         print(f"  Chapters with Sections: {', '.join(verification_report['section_analysis']['chapters_with_sections'])}")
         print(f"  Status: {verification_report['summary']['recommendation']}")
 
@@ -311,15 +419,15 @@ RECOMMENDATION: {summary['recommendation']}
             f"{self.regulation_name}_section_verification.json"
         )
 
-        with open(verification_file, 'w', encoding='utf-8') as f:
-            json.dump(verification_report, f, indent=2, ensure_ascii=False)
+        _write_json(verification_file, self._report_for_file(verification_report, "sections", accuracy))
 
         print(f"  Saved verification report: {verification_file}")
 
         # Save enhanced sections with verification
         enhanced_sections = self._enhance_sections_with_verification(
             self._convert_sections_to_dict(sections),
-            verification_report["sections"]
+            verification_report["sections"],
+            copy=False
         )
 
         enhanced_file = os.path.join(
@@ -327,21 +435,20 @@ RECOMMENDATION: {summary['recommendation']}
             f"{self.regulation_name}_sections_with_verification.json"
         )
 
-        enhanced_data = {
+        now = datetime.now()
+        enhanced_head = {
             "document": self.regulation_name,
-            "extraction_date": datetime.now().strftime("%Y-%m-%d"),
-            "extraction_timestamp": datetime.now().isoformat(),
+            "extraction_date": now.strftime("%Y-%m-%d"),
+            "extraction_timestamp": now.isoformat(),
             "verification_summary": {
                 "accuracy_percentage": accuracy,
                 "total_sections": total_sections,
                 "successful_verifications": successful,
                 "verification_timestamp": verification_report["verification_metadata"]["verification_timestamp"]
-            },
-            "sections": enhanced_sections
+            }
         }
 
-        with open(enhanced_file, 'w', encoding='utf-8') as f:
-            json.dump(enhanced_data, f, indent=2, ensure_ascii=False)
+        _write_json_stream(enhanced_file, enhanced_head, "sections", enhanced_sections)
 
         print(f"  Saved enhanced sections: {enhanced_file}")
 
@@ -353,7 +460,7 @@ RECOMMENDATION: {summary['recommendation']}
             # Log failed verifications
             failed_sections = [
                 sec for sec in verification_report["sections"]
-                if not sec.get("exact_match", False)
+                if sec.get("verification_status") == "FAIL"
             ]
 
             if failed_sections:
@@ -366,7 +473,8 @@ RECOMMENDATION: {summary['recommendation']}
     def _enhance_sections_with_verification(
         self,
         sections_data: List[Dict[str, Any]],
-        verification_results: List[Dict[str, Any]]
+        verification_results: List[Dict[str, Any]],
+        copy: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Enhance section data with verification results.
@@ -374,24 +482,25 @@ RECOMMENDATION: {summary['recommendation']}
         Args:
             sections_data: Original section data
             verification_results: Verification results
+            copy: Copy each section dict before adding verification info. When False,
+                the dicts in sections_data are updated in place and the same list is returned.
 
         Returns:
             Enhanced section data with verification info
         """
-        # Create lookup for verification results
-        verification_lookup = {}
-        for result in verification_results:
-            key = f"{result['parent_chapter']}_{result['section_number']}"
-            verification_lookup[key] = result
+        # Create lookup for verification results keyed by (parent_chapter, section_number)
+        verification_lookup = {
+            (result["parent_chapter"], result["section_number"]): result
+            for result in verification_results
+        }
 
-        enhanced_sections = []
+        enhanced_sections = [] if copy else sections_data
         for section in sections_data:
-            enhanced_section = section.copy()
+            enhanced_section = section.copy() if copy else section
 
             # Add verification data
-            section_key = f"{section.get('parent_chapter')}_{section.get('section_number')}"
-            if section_key in verification_lookup:
-                verification = verification_lookup[section_key]
+            verification = verification_lookup.get((section.get("parent_chapter"), section.get("section_number")))
+            if verification is not None:
                 enhanced_section["verification"] = {
                     "exact_match": verification.get("exact_match", False),
                     "confidence": verification.get("confidence", 0),
@@ -407,7 +516,8 @@ RECOMMENDATION: {summary['recommendation']}
                     "issues": ["No verification data available"]
                 }
 
-            enhanced_sections.append(enhanced_section)
+            if copy:
+                enhanced_sections.append(enhanced_section)
 
         return enhanced_sections
 
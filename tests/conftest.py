@@ -0,0 +1,100 @@
+import sys
+import os
+import json
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+import pytest
+from src.pdf_extractor import extract_text, extract_text_with_line_numbers
+from src.transform.page_iterator import iterate_pages_with_lines
+from src.transform.models import ChapterInfo, ChaptersOnPage, ChaptersOnPages, ArticleInfo, ArticlesInChapter
+from src.transform.chapter_identifier import ChapterIdentifier
+from src.transform.article_extractor import ArticleExtractor
+
+DORA_PDF_PATH = "data/dora/level1/DORA_Regulation_EU_2022_2554.pdf"
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+def pytest_addoption(parser):
+    parser.addoption("--no-llm", action="store_true", default=False,
+                     help="Skip tests marked slow, which make live LLM calls")
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: makes live LLM calls (needs OPENROUTER_API_KEY)")
+    config.addinivalue_line("markers", "integration: runs a full extraction pipeline on a real document")
+    # Registered by pytest-xdist when installed; declared here so runs without it do not warn
+    config.addinivalue_line("markers", "xdist_group(name): keep tests on one pytest-xdist worker under --dist loadgroup")
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--no-llm"):
+        return
+    skip_live = pytest.mark.skip(reason="live LLM calls disabled by --no-llm")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_live)
+
+def _load_fixture(name):
+    """Load a JSON file from tests/fixtures"""
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+@pytest.fixture(scope="session")
+def dora_text():
+    """Full text of the DORA regulation, extracted once per test session"""
+    return extract_text(DORA_PDF_PATH)
+
+@pytest.fixture(scope="session")
+def dora_numbered_text():
+    """(numbered_text, line_mapping, numbered_lines) for the DORA regulation, extracted once per test session"""
+    return extract_text_with_line_numbers(DORA_PDF_PATH)
+
+@pytest.fixture(scope="session")
+def dora_pages():
+    """(page_number, numbered_page_text, line_offset) for every DORA page, extracted once per test session"""
+    return list(iterate_pages_with_lines(DORA_PDF_PATH))
+
+def _patch_llm(monkeypatch):
+    """
+    Replace the chapter and article LLM calls with golden DORA responses.
+
+    Chapters are answered per page from tests/fixtures/chapter_responses.json and
+    articles per chapter from tests/fixtures/article_responses.json.
+    """
+    chapters = [ChapterInfo(**chapter) for chapter in _load_fixture("chapter_responses.json")["chapters"]]
+    articles = [ArticleInfo(**article) for article in _load_fixture("article_responses.json")["articles"]]
+
+    def identify_chapters_on_page(self, page_text, page_num):
+        found = [chapter.model_copy() for chapter in chapters if chapter.page_number == page_num]
+        return ChaptersOnPage(page_number=page_num, chapters=found, has_chapters=bool(found))
+
+    def identify_chapters_on_page_batch(self, pages):
+        page_numbers = [page_num for page_num, _ in pages]
+        found = [chapter.model_copy() for chapter in chapters if chapter.page_number in page_numbers]
+        return ChaptersOnPages(page_numbers=page_numbers, chapters=found, has_chapters=bool(found))
+
+    def extract_articles_from_chapter(self, chapter_content, chapter_number, chapter_start_line):
+        found = [article.model_copy() for article in articles if article.parent_chapter == chapter_number]
+        return ArticlesInChapter(chapter_number=chapter_number, articles=found, has_articles=bool(found))
+
+    monkeypatch.setattr(ChapterIdentifier, "identify_chapters_on_page", identify_chapters_on_page)
+    monkeypatch.setattr(ChapterIdentifier, "identify_chapters_on_page_batch", identify_chapters_on_page_batch)
+    monkeypatch.setattr(ArticleExtractor, "extract_articles_from_chapter", extract_articles_from_chapter)
+
+    # The identifiers still build an OpenRouter client, which needs some key
+    monkeypatch.setenv("OPENROUTER_API_KEY", os.getenv("OPENROUTER_API_KEY") or "mock-llm")
+
+@pytest.fixture
+def mock_llm(monkeypatch):
+    """LLM calls answered from golden fixtures, so deterministic post-processing runs without network access"""
+    _patch_llm(monkeypatch)
+
+@pytest.fixture(scope="session")
+def dora_all_chapters(dora_pages):
+    """
+    Chapters of the whole DORA document, extracted once per test session.
+
+    Runs extract_all_chapters_auto with golden LLM responses, reusing the
+    session's parsed pages, so tests can slice page ranges from one run.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _patch_llm(monkeypatch)
+        monkeypatch.setattr("src.transform.chapter_identifier.iterate_pages_with_lines", lambda pdf_path: iter(dora_pages))
+        return ChapterIdentifier().extract_all_chapters_auto(DORA_PDF_PATH)
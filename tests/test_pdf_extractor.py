@@ -1,13 +1,14 @@
 import sys
 import os
+import pytest
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from src.pdf_extractor import extract_text
+from src import pdf_extractor
+from src.pdf_extractor import extract_text, extract_text_with_line_numbers
 
-def test_extract_text():
+def test_extract_text(dora_text):
     """Test extracting text from DORA regulation PDF"""
-    # Test with main DORA regulation
-    pdf_path = "data/dora/level1/DORA_Regulation_EU_2022_2554.pdf"
-    text = extract_text(pdf_path)
+    # Test with main DORA regulation (extracted once by the session fixture)
+    text = dora_text
 
     # Basic assertions
     assert len(text) > 0, "Should extract some text"
@@ -25,7 +26,67 @@ def test_extract_text_level2():
     assert len(text) > 0, "Should extract some text from Level 2 document"
     print(f"Extracted {len(text)} characters from Level 2 document")
 
+def test_extract_text_is_cached(dora_text):
+    """Test repeated extraction of an unchanged PDF reuses the cached text"""
+    assert extract_text("data/dora/level1/DORA_Regulation_EU_2022_2554.pdf") is dora_text
+
+def test_extract_text_keeps_journal_header_first(dora_text):
+    """Test the default backend keeps the Official Journal header within the metadata prompt window"""
+    assert dora_text.startswith("27.12.2022 EN Official Journal of the European Union L 333/1\n")
+
+def test_extract_text_pdfium_matches_pdfplumber_lines(monkeypatch):
+    """Test the pdfium backend yields the same first-page lines as pdfplumber, without trailing spaces"""
+    pdf_path = "data/dora/level1/DORA_Regulation_EU_2022_2554.pdf"
+    plumber_lines = extract_text(pdf_path).split('\n')
+    monkeypatch.setenv("AKN_PDF_BACKEND", "pdfium")
+    pdfium_lines = extract_text(pdf_path).split('\n')
+
+    assert all(line == line.rstrip() for line in pdfium_lines)
+    # pdfium emits the running header later in the page and splits footnote markers
+    # differently, so compare the opening body lines
+    assert pdfium_lines[:12] == plumber_lines[1:13]
+
+def test_extract_text_rejects_unknown_backend(monkeypatch):
+    """Test an unsupported AKN_PDF_BACKEND value is reported"""
+    monkeypatch.setenv("AKN_PDF_BACKEND", "unknown")
+
+    with pytest.raises(ValueError):
+        extract_text("data/dora/level1/DORA_Regulation_EU_2022_2554.pdf")
+
+def test_extract_text_with_line_numbers_is_cached_on_disk(tmp_path, monkeypatch):
+    """Test line-numbered text is pickled under .cache and reused without re-parsing the PDF"""
+    pdf_path = os.path.abspath("data/dora/level2/pillar1_ict_risk/Commission_Delegated_Regulation_2024_1774_ICT_Risk_Management.pdf")
+    monkeypatch.chdir(tmp_path)
+    pdf_extractor._extract_text_with_line_numbers_cached.cache_clear()
+
+    numbered_text, line_mapping, numbered_lines = extract_text_with_line_numbers(pdf_path)
+    assert numbered_text.startswith("   1: ")
+    assert numbered_lines == numbered_text.split('\n')
+    assert len(list((tmp_path / ".cache").glob("numbered_lines_*.pkl"))) == 1
+
+    # A fresh process (empty in-memory cache) must read the pickle, not the PDF
+    pdf_extractor._extract_text_with_line_numbers_cached.cache_clear()
+    def fail(pdf_path):
+        raise AssertionError("PDF was re-parsed")
+    monkeypatch.setattr(pdf_extractor, "_extract_text_with_line_numbers", fail)
+
+    assert extract_text_with_line_numbers(pdf_path) == (numbered_text, line_mapping, numbered_lines)
+    pdf_extractor._extract_text_with_line_numbers_cached.cache_clear()
+
+def test_extract_text_with_line_numbers_cache_off(tmp_path, monkeypatch):
+    """Test AKN_PDF_CACHE=off parses the PDF on every call and writes no cache file"""
+    pdf_path = os.path.abspath("data/dora/level2/pillar1_ict_risk/Commission_Delegated_Regulation_2024_1774_ICT_Risk_Management.pdf")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AKN_PDF_CACHE", "off")
+    calls = []
+    def extract(pdf_path):
+        calls.append(pdf_path)
+        return "   1: text", {1: (1, 1)}, ["   1: text"]
+    monkeypatch.setattr(pdf_extractor, "_extract_text_with_line_numbers", extract)
+
+    assert extract_text_with_line_numbers(pdf_path) == extract_text_with_line_numbers(pdf_path)
+    assert len(calls) == 2
+    assert not (tmp_path / ".cache").exists()
+
 if __name__ == "__main__":
-    test_extract_text()
-    test_extract_text_level2()
-    print("All tests passed!")
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
\ No newline at end of file
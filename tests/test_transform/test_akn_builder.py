@@ -1,7 +1,12 @@
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+import xml.etree.ElementTree as ET
 from src.transform.akn_builder import create_akoma_ntoso_root
+from src.transform.models import ChapterInfo, ArticleInfo, SectionInfo
+from src.transform.chapter_builder import build_chapters_xml, build_chapters_with_sections_xml, validate_chapter_xml
+from src.transform.article_builder import build_chapters_with_articles_xml, escape_xml
+from src.transform.recitals_builder import build_recitals_xml
 
 def test_create_akoma_ntoso_root():
     """Test creating the basic Akoma Ntoso root element"""
@@ -10,13 +15,58 @@ def test_create_akoma_ntoso_root():
     # Basic assertions
     assert xml is not None, "Should return XML string"
     assert len(xml) > 0, "Should not be empty"
-    assert '<akomaNtoso' in xml, "Should contain root element"
-    assert 'xmlns="http://docs.oasis-open.org/legaldocml/ns/akn/3.0"' in xml, "Should contain correct namespace"
-    assert '</akomaNtoso>' in xml, "Should contain closing tag"
+
+    # One parse checks the root element, its namespace and that it is closed
+    root = ET.fromstring(xml)
+    assert root.tag == "{http://docs.oasis-open.org/legaldocml/ns/akn/3.0}akomaNtoso", "Should be an akomaNtoso root in the AKN namespace"
 
     print("Generated Akoma Ntoso root element:")
     print(xml)
 
+def test_builders_escape_text_content():
+    """Test headings and recitals with XML special characters stay well-formed"""
+    chapters = [ChapterInfo(chapter_number="I", title="Scope & <definitions>", start_line=10, page_number=1, confidence=100)]
+    articles = [ArticleInfo(article_number=1, title="Terms 'used' & \"defined\"", start_line=12, parent_chapter="I", confidence=100)]
+
+    chapters_root = ET.fromstring(build_chapters_xml(chapters))
+    assert chapters_root.find("chapter/heading").text == "Scope & <definitions>"
+
+    articles_root = ET.fromstring(build_chapters_with_articles_xml(chapters, articles))
+    assert articles_root.find("chapter/article/heading").text == "Terms 'used' & \"defined\""
+
+    recitals_root = ET.fromstring(build_recitals_xml("Whereas:\n(1) Research & development <matters>."))
+    assert recitals_root.find("recitals/recital/p").text == "Research & development <matters>."
+
+def test_escape_xml():
+    """Test all five XML special characters are escaped, ampersands first"""
+    assert escape_xml('Tom & "Jerry" <b>\'s</b> &amp;') == "Tom &amp; &quot;Jerry&quot; &lt;b&gt;&apos;s&lt;/b&gt; &amp;amp;"
+    assert escape_xml("plain text") == "plain text"
+    assert escape_xml("") == ""
+    assert escape_xml(None) == ""
+
+def test_validate_chapter_xml():
+    """Test chapter XML validation on the parsed tree"""
+    chapters = [
+        ChapterInfo(chapter_number="I", title="General provisions", start_line=1005, page_number=23, confidence=95),
+        ChapterInfo(chapter_number="II", title="ICT risk management", start_line=1261, page_number=29, confidence=100),
+    ]
+    sections = [SectionInfo(section_number="I", parent_chapter="II", start_line=1263, confidence=100)]
+
+    validation = validate_chapter_xml(build_chapters_xml(chapters))
+    assert validation.is_well_formed
+    assert validation.chapter_count == 2
+    assert validation.all_chapters_complete
+    assert validation["chapter_count"] == 2  # dict-style access still works
+
+    # Section <num> elements must not upset the per-chapter check
+    assert validate_chapter_xml(build_chapters_with_sections_xml(chapters, sections)).all_chapters_complete
+
+    broken = validate_chapter_xml(build_chapters_xml(chapters).replace("</chapter>", "", 1))
+    assert not broken.is_well_formed
+    assert not broken.all_chapters_complete
+
 if __name__ == "__main__":
     test_create_akoma_ntoso_root()
+    test_builders_escape_text_content()
+    test_validate_chapter_xml()
     print("Root element test passed!")
\ No newline at end of file
@@ -1,20 +1,25 @@
 import unittest
 import sys
 import os
+import xml.etree.ElementTree as ET
+from unittest import mock
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from src.transform.article_identifier import ArticleIdentifier
-from src.transform.article_builder import build_chapters_with_articles_xml, get_articles_summary, build_article_xml
+from src.transform.article_extractor import ArticleExtractor
+from src.transform.article_builder import build_chapters_with_articles_xml, get_hierarchy_summary, build_article_xml
 from src.transform.models import ArticleInfo, ChapterInfo
 
 class TestArticleExtraction(unittest.TestCase):
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.identifier = ArticleIdentifier()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures once for the class; no test modifies them"""
+        # The extractor builds an OpenRouter client, which needs some key; no test calls the LLM
+        with mock.patch.dict(os.environ, {"OPENROUTER_API_KEY": os.getenv("OPENROUTER_API_KEY") or "mock-llm"}):
+            cls.extractor = ArticleExtractor()
 
         # Sample chapters for testing
-        self.sample_chapters = [
+        cls.sample_chapters = [
             ChapterInfo(
                 chapter_number="I",
                 title="General provisions",
@@ -32,35 +37,26 @@ class TestArticleExtraction(unittest.TestCase):
         ]
 
         # Sample articles for testing
-        self.sample_articles = [
+        cls.sample_articles = [
             ArticleInfo(
                 article_number=1,
                 title="Subject matter",
                 start_line=1007,
-                end_line=1035,
                 parent_chapter="I",
-                start_page=23,
-                end_page=24,
                 confidence=95
             ),
             ArticleInfo(
                 article_number=2,
                 title="Scope",
                 start_line=1037,
-                end_line=1076,
                 parent_chapter="I",
-                start_page=24,
-                end_page=25,
                 confidence=92
             ),
             ArticleInfo(
                 article_number=3,
                 title="Definitions",
                 start_line=1079,
-                end_line=1199,
                 parent_chapter="I",
-                start_page=25,
-                end_page=26,
                 confidence=88
             )
         ]
@@ -71,20 +67,15 @@ class TestArticleExtraction(unittest.TestCase):
             article_number=1,
             title="Test Article",
             start_line=100,
-            end_line=150,
             parent_chapter="I",
-            start_page=5,
-            end_page=6,
             confidence=95
         )
 
         self.assertEqual(article.article_number, 1)
         self.assertEqual(article.title, "Test Article")
         self.assertEqual(article.start_line, 100)
-        self.assertEqual(article.end_line, 150)
         self.assertEqual(article.parent_chapter, "I")
-        self.assertEqual(article.start_page, 5)
-        self.assertEqual(article.end_page, 6)
+        self.assertIsNone(article.parent_section)
         self.assertEqual(article.confidence, 95)
 
     def test_article_boundaries(self):
@@ -95,7 +86,6 @@ class TestArticleExtraction(unittest.TestCase):
                 title="First",
                 start_line=100,
                 parent_chapter="I",
-                start_page=1,
                 confidence=95
             ),
             ArticleInfo(
@@ -103,30 +93,28 @@ class TestArticleExtraction(unittest.TestCase):
                 title="Second",
                 start_line=200,
                 parent_chapter="I",
-                start_page=2,
                 confidence=90
             )
         ]
 
-        self.identifier._set_article_boundaries(articles)
+        pdf_lines = {line: f"line {line}" for line in range(100, 251)}
+        self.extractor._extract_article_content(articles, pdf_lines)
 
         # First article should end where second starts
-        self.assertEqual(articles[0].end_line, 199)
-        # Last article should have no end_line
-        self.assertIsNone(articles[1].end_line)
+        self.assertEqual(articles[0].raw_content.split('\n')[-1], "line 199")
+        # Last article should run to the end of the document
+        self.assertEqual(articles[1].raw_content.split('\n')[0], "line 200")
+        self.assertEqual(articles[1].raw_content.split('\n')[-1], "line 250")
 
     def test_get_articles_summary(self):
         """Test articles summary generation"""
-        summary = get_articles_summary(self.sample_articles)
+        summary = get_hierarchy_summary(self.sample_chapters, [], self.sample_articles)
 
-        self.assertEqual(summary['count'], 3)
-        self.assertEqual(summary['first_article'], 1)
-        self.assertEqual(summary['last_article'], 3)
-        self.assertEqual(summary['chapters_with_articles'], ['I'])
-        self.assertIn('I', summary['articles_by_chapter'])
-        self.assertEqual(summary['articles_by_chapter']['I']['count'], 3)
-        self.assertEqual(summary['articles_by_chapter']['I']['first_article'], 1)
-        self.assertEqual(summary['articles_by_chapter']['I']['last_article'], 3)
+        self.assertEqual(summary['total_chapters'], 2)
+        self.assertEqual(summary['total_articles'], 3)
+        self.assertEqual(summary['articles_by_chapter'], {'I': 3, 'II': 0})
+        self.assertEqual(summary['articles_under_chapters'], 3)
+        self.assertEqual(summary['articles_under_sections'], 0)
 
     def test_build_article_xml(self):
         """Test individual article XML generation"""
@@ -142,37 +130,28 @@ class TestArticleExtraction(unittest.TestCase):
         """Test complete chapters with articles XML generation"""
         xml = build_chapters_with_articles_xml(self.sample_chapters, self.sample_articles)
 
-        # Check for body structure
-        self.assertIn('<body>', xml)
-        self.assertIn('</body>', xml)
+        # Parse once; this also checks the output is well-formed
+        root = ET.fromstring(xml)
+        self.assertEqual(root.tag, 'body')
 
         # Check for chapter structure
-        self.assertIn('<chapter id="chp_I">', xml)
-        self.assertIn('<num>CHAPTER I</num>', xml)
-        self.assertIn('<heading>General provisions</heading>', xml)
-
-        # Check for articles within chapter
-        self.assertIn('<article id="art_1">', xml)
-        self.assertIn('<article id="art_2">', xml)
-        self.assertIn('<article id="art_3">', xml)
+        chapter = root.find("chapter[@id='chp_I']")
+        self.assertIsNotNone(chapter)
+        self.assertEqual(chapter.findtext('num'), 'CHAPTER I')
+        self.assertEqual(chapter.findtext('heading'), 'General provisions')
 
         # Check hierarchy (articles nested in chapters)
-        chapter_pos = xml.find('<chapter id="chp_I">')
-        article_pos = xml.find('<article id="art_1">')
-        chapter_end_pos = xml.find('</chapter>')
-
-        self.assertTrue(chapter_pos < article_pos < chapter_end_pos)
+        for article_id in ('art_1', 'art_2', 'art_3'):
+            self.assertIsNotNone(chapter.find(f"article[@id='{article_id}']"))
 
     def test_empty_articles_summary(self):
         """Test summary with empty articles list"""
-        summary = get_articles_summary([])
+        summary = get_hierarchy_summary([], [], [])
 
-        self.assertEqual(summary['count'], 0)
-        self.assertIsNone(summary['first_article'])
-        self.assertIsNone(summary['last_article'])
-        self.assertEqual(summary['chapters_with_articles'], [])
+        self.assertEqual(summary['total_chapters'], 0)
+        self.assertEqual(summary['total_articles'], 0)
         self.assertEqual(summary['articles_by_chapter'], {})
-        self.assertEqual(summary['confidence_avg'], 0)
+        self.assertEqual(summary['articles_by_section'], {})
 
     def test_empty_chapters_xml(self):
         """Test XML generation with empty chapters list"""
@@ -184,17 +163,15 @@ class TestArticleExtraction(unittest.TestCase):
 
     def test_validate_article_sequence(self):
         """Test article sequence validation"""
-        validation = self.identifier.validate_article_sequence(self.sample_articles)
+        validation = self.extractor.validate_articles(self.sample_articles)
 
-        self.assertIn('I', validation)
-        chapter_validation = validation['I']
+        self.assertIn('I', validation['articles_by_chapter'])
+        chapter_validation = validation['articles_by_chapter']['I']
 
-        self.assertEqual(chapter_validation['total_articles'], 3)
+        self.assertEqual(chapter_validation['count'], 3)
         self.assertEqual(chapter_validation['article_numbers'], [1, 2, 3])
-        self.assertEqual(chapter_validation['expected_sequence'], [1, 2, 3])
         self.assertTrue(chapter_validation['is_sequential'])
-        self.assertEqual(chapter_validation['missing_articles'], [])
-        self.assertEqual(chapter_validation['unexpected_articles'], [])
+        self.assertEqual(validation['validation_issues'], [])
 
     def test_validate_broken_sequence(self):
         """Test validation with broken article sequence"""
@@ -204,7 +181,6 @@ class TestArticleExtraction(unittest.TestCase):
                 title="First",
                 start_line=100,
                 parent_chapter="I",
-                start_page=1,
                 confidence=95
             ),
             ArticleInfo(
@@ -212,22 +188,19 @@ class TestArticleExtraction(unittest.TestCase):
                 title="Third",
                 start_line=200,
                 parent_chapter="I",
-                start_page=2,
                 confidence=90
             )
         ]
 
-        validation = self.identifier.validate_article_sequence(broken_articles)
+        validation = self.extractor.validate_articles(broken_articles)
 
-        self.assertIn('I', validation)
-        chapter_validation = validation['I']
+        self.assertIn('I', validation['articles_by_chapter'])
+        chapter_validation = validation['articles_by_chapter']['I']
 
-        self.assertEqual(chapter_validation['total_articles'], 2)
+        self.assertEqual(chapter_validation['count'], 2)
         self.assertEqual(chapter_validation['article_numbers'], [1, 3])
-        self.assertEqual(chapter_validation['expected_sequence'], [1, 2])
         self.assertFalse(chapter_validation['is_sequential'])
-        self.assertEqual(chapter_validation['missing_articles'], [2])
-        self.assertEqual(chapter_validation['unexpected_articles'], [3])
+        self.assertEqual(validation['validation_issues'], ["Chapter I: Non-sequential numbering [1, 3]"])
 
     def test_multiple_chapters_with_articles(self):
         """Test articles across multiple chapters"""
@@ -237,19 +210,18 @@ class TestArticleExtraction(unittest.TestCase):
                 title="ICT Strategy",
                 start_line=1205,
                 parent_chapter="II",
-                start_page=25,
                 confidence=85
             )
         ]
 
-        summary = get_articles_summary(multi_chapter_articles)
+        summary = get_hierarchy_summary(self.sample_chapters, [], multi_chapter_articles)
+
+        self.assertEqual(summary['total_articles'], 4)
+        self.assertEqual(summary['articles_by_chapter']['I'], 3)
+        self.assertEqual(summary['articles_by_chapter']['II'], 1)
 
-        self.assertEqual(summary['count'], 4)
-        self.assertEqual(len(summary['chapters_with_articles']), 2)
-        self.assertIn('I', summary['chapters_with_articles'])
-        self.assertIn('II', summary['chapters_with_articles'])
-        self.assertEqual(summary['articles_by_chapter']['I']['count'], 3)
-        self.assertEqual(summary['articles_by_chapter']['II']['count'], 1)
+        validation = self.extractor.validate_articles(multi_chapter_articles)
+        self.assertEqual(validation['chapters_with_articles'], ['I', 'II'])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
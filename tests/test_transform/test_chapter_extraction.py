@@ -1,9 +1,11 @@
 import sys
 import os
+import pytest
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from src.transform.chapter_identifier import ChapterIdentifier
+from src.transform.chapter_identifier import ChapterIdentifier, int_to_roman
 
+@pytest.mark.slow
 def test_chapter_extraction():
     """Test chapter extraction on DORA regulation"""
     print("=== Chapter Extraction Test ===\n")
@@ -67,26 +69,64 @@ def test_chapter_extraction():
         print("   Make sure OPENROUTER_API_KEY is set in .env file")
         return None
 
-def test_single_page():
+def test_single_page(dora_pages):
     """Test chapter identification on a specific page"""
     print("\n=== Single Page Test ===")
 
-    # Test page iterator
-    from src.transform.page_iterator import iterate_pages_with_lines
-
-    pdf_path = "data/dora/level1/DORA_Regulation_EU_2022_2554.pdf"
-
+    # Test page iterator output (pages extracted once by the session fixture)
     print("Testing page iterator on first 3 pages...")
-    page_count = 0
-    for page_num, page_text, line_offset in iterate_pages_with_lines(pdf_path):
-        page_count += 1
+    for page_num, page_text, line_offset in dora_pages[:3]:
         print(f"Page {page_num}: {len(page_text)} characters, starts at line {line_offset}")
 
-        if page_count >= 3:
-            break
+    assert dora_pages[0][0] == 1
+    assert dora_pages[0][2] == 1
 
     print("[OK] Page iterator test completed!")
 
+def test_parallel_page_iterator_matches_serial(dora_pages):
+    """Test parallel page extraction yields the same pages and line numbers"""
+    from src.transform.page_iterator import iterate_pages_with_lines_parallel
+
+    pdf_path = "data/dora/level1/DORA_Regulation_EU_2022_2554.pdf"
+    assert list(iterate_pages_with_lines_parallel(pdf_path, max_workers=2)) == dora_pages
+
+def test_page_batches_match_single_page_requests():
+    """Test batched chapter identification groups pages and returns the same chapters"""
+    from src.transform.models import ChapterInfo, ChaptersOnPage, ChaptersOnPages
+
+    def chapter_on(page_num):
+        return ChapterInfo(chapter_number="I", title="General provisions", start_line=page_num * 40, page_number=page_num, confidence=95)
+
+    requests = []
+
+    def identify_page(page_text, page_num):
+        requests.append((page_num,))
+        chapters = [chapter_on(page_num)] if page_num % 3 == 0 else []
+        return ChaptersOnPage(page_number=page_num, chapters=chapters, has_chapters=bool(chapters))
+
+    def identify_batch(pages):
+        requests.append(tuple(page_num for page_num, _ in pages))
+        chapters = [chapter_on(page_num) for page_num, _ in pages if page_num % 3 == 0]
+        return ChaptersOnPages(page_numbers=[page_num for page_num, _ in pages], chapters=chapters, has_chapters=bool(chapters))
+
+    # No client is needed since the LLM calls are replaced
+    identifier = object.__new__(ChapterIdentifier)
+    identifier.identify_chapters_on_page = identify_page
+    identifier.identify_chapters_on_page_batch = identify_batch
+    pages = [(page_num, f"page {page_num}") for page_num in range(1, 12)]
+
+    single = identifier._identify_chapters_on_pages(pages, max_workers=2)
+    assert len(requests) == 11
+
+    requests.clear()
+    batched = identifier._identify_chapters_on_pages(pages, max_workers=2, batch_size=5)
+    assert sorted(requests) == [(1, 2, 3, 4, 5), (6, 7, 8, 9, 10), (11,)]
+    assert batched == single
+
+def test_int_to_roman():
+    """Test Roman numeral conversion used for chapter sequence validation"""
+    assert [int_to_roman(i) for i in (1, 4, 9, 14, 40, 49, 90, 100)] == ["I", "IV", "IX", "XIV", "XL", "XLIX", "XC", "C"]
+
 if __name__ == "__main__":
-    test_single_page()
-    test_chapter_extraction()
\ No newline at end of file
+    import pytest
+    sys.exit(pytest.main([__file__, "-v", "-s"]))
\ No newline at end of file
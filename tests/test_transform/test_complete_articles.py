@@ -1,43 +1,71 @@
 import unittest
+import pytest
 import sys
 import os
+import json
+import tempfile
+import xml.etree.ElementTree as ET
+from operator import attrgetter
+from unittest import mock
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from src.transform.article_identifier import ArticleIdentifier
-from src.transform.chapter_identifier import ChapterIdentifier
-from src.transform.article_builder import build_chapters_with_articles_xml, get_articles_summary
+from src.pdf_extractor import extract_text_with_line_numbers, extract_lines_range
+from src.transform.article_extractor import ArticleExtractor
+from src.transform.article_builder import build_chapters_with_articles_xml, get_hierarchy_summary
 
 class TestCompleteArticleExtraction(unittest.TestCase):
 
-    def setUp(self):
-        """Set up test fixtures"""
-        self.pdf_path = "data/dora/level1/DORA_Regulation_EU_2022_2554.pdf"
-        self.article_identifier = ArticleIdentifier()
-        self.chapter_identifier = ChapterIdentifier()
-
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures once for the class"""
+        cls.pdf_path = "data/dora/level1/DORA_Regulation_EU_2022_2554.pdf"
+        # The extractor builds an OpenRouter client, which needs some key
+        with mock.patch.dict(os.environ, {"OPENROUTER_API_KEY": os.getenv("OPENROUTER_API_KEY") or "mock-llm"}):
+            cls.article_extractor = ArticleExtractor()
+
+    @pytest.fixture
+    def _use_dora_all_chapters(self, dora_all_chapters):
+        """Expose the session's full-document chapter run to the unittest methods that request it"""
+        self.dora_all_chapters = dora_all_chapters
+
+    @pytest.mark.slow
+    @pytest.mark.usefixtures("_use_dora_all_chapters")
     def test_dora_article_extraction_integration(self):
         """Integration test for complete article extraction on DORA document"""
         # Skip if PDF not available
         if not os.path.exists(self.pdf_path):
             self.skipTest(f"PDF not found: {self.pdf_path}")
 
-        # First extract chapters (required for article extraction)
-        print("\nExtracting chapters...")
-        chapters = self.chapter_identifier.extract_all_chapters(
-            self.pdf_path,
-            start_page=22,
-            end_page=30  # Limited range for testing
-        )
+        # Chapters (required for article extraction) are sliced from the session's full run
+        chapters = [chapter for chapter in self.dora_all_chapters if 22 <= chapter.page_number <= 30]
 
         self.assertGreater(len(chapters), 0, "Should find at least one chapter")
         print(f"Found {len(chapters)} chapters")
 
-        # Then extract articles within those chapters
+        # Then extract articles within those chapters; the extractor reads chapter
+        # content and sections from JSON files, as main.py writes them
         print("Extracting articles...")
-        articles = self.article_identifier.extract_all_articles_with_chapters(
-            self.pdf_path,
-            chapters
-        )
+        sorted_chapters = sorted(chapters, key=attrgetter('start_line'))
+        end_lines = [chapter.start_line - 1 for chapter in sorted_chapters[1:]] + [sorted_chapters[-1].start_line + 2000]
+        chapters_data = [
+            {
+                "chapter_number": chapter.chapter_number,
+                "title": chapter.title,
+                "start_line": chapter.start_line,
+                "content": extract_lines_range(self.pdf_path, chapter.start_line, end_line)
+            }
+            for chapter, end_line in zip(sorted_chapters, end_lines)
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            chapters_json = os.path.join(temp_dir, "chapters.json")
+            sections_json = os.path.join(temp_dir, "sections.json")
+            with open(chapters_json, 'w', encoding='utf-8') as f:
+                json.dump({"chapters": chapters_data}, f)
+            with open(sections_json, 'w', encoding='utf-8') as f:
+                json.dump({"sections": []}, f)
+
+            articles = self.article_extractor.extract_all_articles(chapters_json, sections_json)
 
         print(f"Found {len(articles)} articles")
 
@@ -54,11 +82,11 @@ class TestCompleteArticleExtraction(unittest.TestCase):
                 self.assertIn(article.parent_chapter, [ch.chapter_number for ch in chapters])
 
             # Check article sequence validation
-            validation = self.article_identifier.validate_article_sequence(articles)
+            validation = self.article_extractor.validate_articles(articles)
             print(f"Article sequence validation: {validation}")
 
             # Generate summary
-            summary = get_articles_summary(articles)
+            summary = get_hierarchy_summary(chapters, [], articles)
             print(f"Articles summary: {summary}")
 
             # Generate XML
@@ -82,23 +110,27 @@ class TestCompleteArticleExtraction(unittest.TestCase):
         # Create a sample article for testing content extraction
         from src.transform.models import ArticleInfo
 
-        # Article 1 from DORA (based on our analysis)
+        # Article 1 from DORA (based on our analysis); Article 2 bounds its content
         sample_article = ArticleInfo(
             article_number=1,
             title="Subject matter",
             start_line=1007,
-            end_line=1035,
             parent_chapter="I",
-            start_page=23,
-            end_page=24,
+            confidence=95
+        )
+        next_article = ArticleInfo(
+            article_number=2,
+            title="Scope",
+            start_line=1037,
+            parent_chapter="I",
             confidence=95
         )
 
         # Extract content
-        content = self.article_identifier.extract_article_content(
-            self.pdf_path,
-            sample_article
-        )
+        _, _, numbered_lines = extract_text_with_line_numbers(self.pdf_path)
+        pdf_lines = {int(number): text for number, text in (line.split(': ', 1) for line in numbered_lines)}
+        self.article_extractor._extract_article_content([sample_article, next_article], pdf_lines)
+        content = sample_article.raw_content
 
         if content:
             self.assertIsInstance(content, str)
@@ -126,18 +158,14 @@ class TestCompleteArticleExtraction(unittest.TestCase):
                 article_number=1,
                 title="Subject matter",
                 start_line=1005,
-                end_line=1020,
                 parent_chapter="I",
-                start_page=23,
                 confidence=95
             ),
             ArticleInfo(
                 article_number=2,
                 title="Scope",
                 start_line=1025,
-                end_line=1040,
                 parent_chapter="I",
-                start_page=23,
                 confidence=90
             )
         ]
@@ -145,25 +173,15 @@ class TestCompleteArticleExtraction(unittest.TestCase):
         # Generate XML
         xml = build_chapters_with_articles_xml([test_chapter], test_articles)
 
-        # Validate XML structure
-        self.assertIn('<body>', xml)
-        self.assertIn('<chapter id="chp_I">', xml)
-        self.assertIn('<article id="art_1">', xml)
-        self.assertIn('<article id="art_2">', xml)
-        self.assertIn('<num>1</num>', xml)
-        self.assertIn('<num>2</num>', xml)
-        self.assertIn('<heading>Subject matter</heading>', xml)
-        self.assertIn('<heading>Scope</heading>', xml)
-
-        # Check proper nesting
-        lines = xml.split('\n')
-        body_indent = next(i for i, line in enumerate(lines) if '<body>' in line)
-        chapter_indent = next(i for i, line in enumerate(lines) if '<chapter' in line)
-        article_indent = next(i for i, line in enumerate(lines) if '<article' in line)
-
-        # Articles should be indented more than chapters, which are indented more than body
-        self.assertGreater(chapter_indent, body_indent)
-        self.assertGreater(article_indent, chapter_indent)
+        # Parse once; this also checks the output is well-formed
+        root = ET.fromstring(xml)
+        self.assertEqual(root.tag, 'body')
+
+        # Check proper nesting: body > chapter > article
+        articles = root.findall("chapter[@id='chp_I']/article")
+        self.assertEqual([article.get('id') for article in articles], ['art_1', 'art_2'])
+        self.assertEqual([article.findtext('num') for article in articles], ['1', '2'])
+        self.assertEqual([article.findtext('heading') for article in articles], ['Subject matter', 'Scope'])
 
         print("XML structure validation passed")
 
@@ -178,7 +196,6 @@ class TestCompleteArticleExtraction(unittest.TestCase):
                 title="First",
                 start_line=100,
                 parent_chapter="I",
-                start_page=1,
                 confidence=95
             ),
             ArticleInfo(
@@ -186,7 +203,6 @@ class TestCompleteArticleExtraction(unittest.TestCase):
                 title="Second",
                 start_line=200,
                 parent_chapter="I",
-                start_page=2,
                 confidence=90
             ),
             ArticleInfo(
@@ -194,18 +210,22 @@ class TestCompleteArticleExtraction(unittest.TestCase):
                 title="Third",
                 start_line=300,
                 parent_chapter="I",
-                start_page=3,
                 confidence=85
             )
         ]
 
-        # Set boundaries
-        self.article_identifier._set_article_boundaries(test_articles)
+        # Set boundaries by extracting content
+        pdf_lines = {line: f"line {line}" for line in range(100, 351)}
+        self.article_extractor._extract_article_content(test_articles, pdf_lines)
 
         # Check that boundaries were set correctly
-        self.assertEqual(test_articles[0].end_line, 199)  # First ends before second
-        self.assertEqual(test_articles[1].end_line, 299)  # Second ends before third
-        self.assertIsNone(test_articles[2].end_line)     # Last has no end
+        content_ranges = [
+            (article.raw_content.split('\n')[0], article.raw_content.split('\n')[-1])
+            for article in test_articles
+        ]
+        self.assertEqual(content_ranges[0], ("line 100", "line 199"))  # First ends before second
+        self.assertEqual(content_ranges[1], ("line 200", "line 299"))  # Second ends before third
+        self.assertEqual(content_ranges[2], ("line 300", "line 350"))  # Last runs to the end
 
         print("Article boundary detection working correctly")
 
@@ -0,0 +1,48 @@
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+import pytest
+from src.transform._llm_cache import cached_completion
+from src.transform.models import ChaptersOnPage
+
+class _FakeClient:
+    """Stands in for the instructor client and counts completion calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.chat = self
+        self.completions = self
+
+    def create(self, model, response_model, messages):
+        self.calls += 1
+        return response_model(page_number=self.calls, chapters=[], has_chapters=False)
+
+def test_cached_completion_reuses_response(tmp_path, monkeypatch):
+    """Test a repeated prompt is served from the cache, and a new prompt is not"""
+    monkeypatch.chdir(tmp_path)
+    client = _FakeClient()
+    messages = [{"role": "user", "content": "Find chapters on page 1"}]
+
+    first = cached_completion(client, model="m", response_model=ChaptersOnPage, messages=messages)
+    second = cached_completion(client, model="m", response_model=ChaptersOnPage, messages=messages)
+    assert client.calls == 1
+    assert second == first
+    assert second is not first
+
+    cached_completion(client, model="other", response_model=ChaptersOnPage, messages=messages)
+    assert client.calls == 2
+
+def test_cached_completion_can_be_disabled(tmp_path, monkeypatch):
+    """Test AKN_LLM_CACHE=off always calls the LLM"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AKN_LLM_CACHE", "off")
+    client = _FakeClient()
+    messages = [{"role": "user", "content": "Find chapters on page 1"}]
+
+    cached_completion(client, model="m", response_model=ChaptersOnPage, messages=messages)
+    cached_completion(client, model="m", response_model=ChaptersOnPage, messages=messages)
+    assert client.calls == 2
+    assert not (tmp_path / ".cache").exists()
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -9,16 +9,21 @@ from src.pdf_extractor import extract_text
 from src.transform.metadata_extractor import MetadataExtractor
 from src.transform.frbr_builder import build_frbr_metadata
 
+@pytest.fixture(scope="module")
+def extractor():
+    """MetadataExtractor shared by the tests in this module"""
+    return MetadataExtractor()
+
 @pytest.mark.integration
-def test_metadata_extraction_pipeline():
+@pytest.mark.slow
+def test_metadata_extraction_pipeline(dora_text, extractor):
     """Full integration test: PDF → Extract → Validate → FRBR XML"""
 
-    # Step 1: Extract text from DORA
-    text = extract_text("data/dora/level1/DORA_Regulation_EU_2022_2554.pdf")
+    # Step 1: Extract text from DORA (extracted once by the session fixture)
+    text = dora_text
     assert len(text) > 0, "Should extract text from PDF"
 
     # Step 2: Extract metadata with LLM validation
-    extractor = MetadataExtractor()
     metadata, validation = extractor.extract_with_validation(text)
 
     # Step 3: Check validation results
@@ -52,12 +57,12 @@ def test_metadata_extraction_pipeline():
     return metadata, frbr_xml
 
 @pytest.mark.integration
-def test_level2_document_extraction():
+@pytest.mark.slow
+def test_level2_document_extraction(extractor):
     """Test with Level 2 DORA document"""
     text = extract_text("data/dora/level2/pillar1_ict_risk/Commission_Delegated_Regulation_2024_1774_ICT_Risk_Management.pdf")
     assert len(text) > 0
 
-    extractor = MetadataExtractor()
     metadata, validation = extractor.extract_with_validation(text)
 
     print(f"Level 2 document confidence: {validation.confidence}%")
@@ -75,10 +80,4 @@ def test_level2_document_extraction():
 
 if __name__ == "__main__":
     # Run tests manually (requires OPENROUTER_API_KEY)
-    print("Testing DORA Level 1 document...")
-    test_metadata_extraction_pipeline()
-
-    print("\nTesting Level 2 document...")
-    test_level2_document_extraction()
-
-    print("\nAll integration tests passed!")
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v", "-s"]))
\ No newline at end of file
@@ -1,68 +1,75 @@
+import io
 import sys
 import os
+import pytest
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from src.pdf_extractor import extract_text_with_line_numbers, extract_lines_range
+from src.pdf_extractor import extract_lines_range
 from src.transform.preamble_identifier import PreambleIdentifier
 
-def test_preamble_extraction():
+@pytest.mark.slow
+@pytest.mark.xdist_group("dora_pdf")
+def test_preamble_extraction(dora_numbered_text):
     """Test preamble extraction on DORA regulation"""
-    print("=== Preamble Extraction Test ===\n")
+    out = io.StringIO()  # Diagnostics are buffered and written to stdout in one call
+    print("=== Preamble Extraction Test ===\n", file=out)
 
-    # Step 1: Extract text with line numbers
-    print("1. Extracting text with line numbers...")
+    # Step 1: Extract text with line numbers (extracted once by the session fixture)
+    print("1. Extracting text with line numbers...", file=out)
     pdf_path = "data/dora/level1/DORA_Regulation_EU_2022_2554.pdf"
-    numbered_text, line_mapping = extract_text_with_line_numbers(pdf_path)
+    numbered_text, line_mapping, numbered_lines = dora_numbered_text
 
-    print(f"   Extracted {len(numbered_text.split())} lines with numbers")
-    print(f"   Sample first 5 lines:")
-    for line in numbered_text.split('\n')[:5]:
-        print(f"   {line}")
-    print()
+    print(f"   Extracted {len(numbered_lines)} lines with numbers", file=out)
+    print(f"   Sample first 5 lines:", file=out)
+    for line in numbered_lines[:5]:
+        print(f"   {line}", file=out)
+    print(file=out)
 
     # Step 2: Identify preamble location
-    print("2. Identifying preamble with LLM...")
+    print("2. Identifying preamble with LLM...", file=out)
     try:
         identifier = PreambleIdentifier()
-        preamble_location = identifier.identify_preamble(numbered_text)
+        preamble_location = identifier.identify_preamble(numbered_lines)
 
-        print(f"   Preamble found:")
-        print(f"   - Start line: {preamble_location.start_line}")
-        print(f"   - End line: {preamble_location.end_line}")
-        print(f"   - Title: {preamble_location.title}")
-        print(f"   - Date: {preamble_location.date}")
-        print(f"   - Legal basis statements: {len(preamble_location.legal_basis)}")
-        print(f"   - Confidence: {preamble_location.confidence}%")
-        print()
+        print(f"   Preamble found:", file=out)
+        print(f"   - Start line: {preamble_location.start_line}", file=out)
+        print(f"   - End line: {preamble_location.end_line}", file=out)
+        print(f"   - Title: {preamble_location.title}", file=out)
+        print(f"   - Date: {preamble_location.date}", file=out)
+        print(f"   - Legal basis statements: {len(preamble_location.legal_basis)}", file=out)
+        print(f"   - Confidence: {preamble_location.confidence}%", file=out)
+        print(file=out)
 
         # Step 3: Extract exact preamble text
-        print("3. Extracting exact preamble text...")
+        print("3. Extracting exact preamble text...", file=out)
         preamble_text = extract_lines_range(
             pdf_path,
             preamble_location.start_line,
             preamble_location.end_line
         )
 
-        print(f"   Extracted preamble ({len(preamble_text)} characters):")
-        print("   " + "="*60)
-        print(preamble_text[:500] + "..." if len(preamble_text) > 500 else preamble_text)
-        print("   " + "="*60)
-        print()
+        print(f"   Extracted preamble ({len(preamble_text)} characters):", file=out)
+        print("   " + "="*60, file=out)
+        print(preamble_text[:500] + "..." if len(preamble_text) > 500 else preamble_text, file=out)
+        print("   " + "="*60, file=out)
+        print(file=out)
 
         # Step 4: Show legal basis statements
-        print("4. Legal basis statements found:")
+        print("4. Legal basis statements found:", file=out)
         for i, statement in enumerate(preamble_location.legal_basis, 1):
-            print(f"   {i}. {statement[:80]}...")
-        print()
+            print(f"   {i}. {statement[:80]}...", file=out)
+        print(file=out)
 
-        print("[OK] Preamble extraction test completed successfully!")
+        print("[OK] Preamble extraction test completed successfully!", file=out)
 
+        sys.stdout.write(out.getvalue())
         return preamble_location, preamble_text
 
     except Exception as e:
-        print(f"   Error: {e}")
-        print("   Make sure OPENROUTER_API_KEY is set in .env file")
+        print(f"   Error: {e}", file=out)
+        print("   Make sure OPENROUTER_API_KEY is set in .env file", file=out)
+        sys.stdout.write(out.getvalue())
         return None, None
 
 if __name__ == "__main__":
-    test_preamble_extraction()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v", "-s"]))
\ No newline at end of file
@@ -1,91 +1,98 @@
+import io
 import sys
 import os
+import pytest
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from src.pdf_extractor import extract_text_with_line_numbers, extract_lines_range
+from src.pdf_extractor import extract_lines_range
 from src.transform.recitals_identifier import RecitalsIdentifier
 from src.transform.recitals_builder import build_recitals_xml, get_recitals_summary, parse_recitals_text
 
-def test_recitals_extraction():
+@pytest.mark.slow
+@pytest.mark.xdist_group("dora_pdf")
+def test_recitals_extraction(dora_numbered_text):
     """Test recitals extraction on DORA regulation"""
-    print("=== Recitals Extraction Test ===\n")
+    out = io.StringIO()  # Diagnostics are buffered and written to stdout in one call
+    print("=== Recitals Extraction Test ===\n", file=out)
 
-    # Step 1: Extract text with line numbers
-    print("1. Extracting text with line numbers...")
+    # Step 1: Extract text with line numbers (extracted once by the session fixture)
+    print("1. Extracting text with line numbers...", file=out)
     pdf_path = "data/dora/level1/DORA_Regulation_EU_2022_2554.pdf"
-    numbered_text, line_mapping = extract_text_with_line_numbers(pdf_path)
+    numbered_text, line_mapping, numbered_lines = dora_numbered_text
 
-    print(f"   Extracted {len(numbered_text.split())} lines with numbers")
-    print()
+    print(f"   Extracted {len(numbered_lines)} lines with numbers", file=out)
+    print(file=out)
 
     # Step 2: Identify recitals location
-    print("2. Identifying recitals with LLM...")
+    print("2. Identifying recitals with LLM...", file=out)
     try:
         identifier = RecitalsIdentifier()
-        recitals_location = identifier.identify_recitals(numbered_text)
+        recitals_location = identifier.identify_recitals(numbered_lines)
 
-        print(f"   Recitals found:")
-        print(f"   - Start line (Whereas:): {recitals_location.start_line}")
-        print(f"   - End line: {recitals_location.end_line}")
-        print(f"   - First recital line: {recitals_location.first_recital_line}")
-        print(f"   - Total recitals: {recitals_location.recital_count}")
-        print(f"   - Last recital number: ({recitals_location.last_recital_number})")
-        print(f"   - Confidence: {recitals_location.confidence}%")
-        print()
+        print(f"   Recitals found:", file=out)
+        print(f"   - Start line (Whereas:): {recitals_location.start_line}", file=out)
+        print(f"   - End line: {recitals_location.end_line}", file=out)
+        print(f"   - First recital line: {recitals_location.first_recital_line}", file=out)
+        print(f"   - Total recitals: {recitals_location.recital_count}", file=out)
+        print(f"   - Last recital number: ({recitals_location.last_recital_number})", file=out)
+        print(f"   - Confidence: {recitals_location.confidence}%", file=out)
+        print(file=out)
 
         # Step 3: Extract exact recitals text
-        print("3. Extracting exact recitals text...")
+        print("3. Extracting exact recitals text...", file=out)
         recitals_text = extract_lines_range(
             pdf_path,
             recitals_location.start_line,
             recitals_location.end_line
         )
 
-        print(f"   Extracted recitals ({len(recitals_text)} characters)")
-        print("   Sample first 300 characters:")
-        print("   " + "="*60)
-        print(recitals_text[:300] + "...")
-        print("   " + "="*60)
-        print()
+        print(f"   Extracted recitals ({len(recitals_text)} characters)", file=out)
+        print("   Sample first 300 characters:", file=out)
+        print("   " + "="*60, file=out)
+        print(recitals_text[:300] + "...", file=out)
+        print("   " + "="*60, file=out)
+        print(file=out)
 
         # Step 4: Parse individual recitals
-        print("4. Parsing individual recitals...")
+        print("4. Parsing individual recitals...", file=out)
         recitals = parse_recitals_text(recitals_text)
-        summary = get_recitals_summary(recitals_text)
+        summary = get_recitals_summary(recitals_text, recitals)
 
-        print(f"   Parsed {summary['count']} recitals")
-        print(f"   Numbers: ({summary['first_number']}) to ({summary['last_number']})")
-        print(f"   Average length: {summary['average_length']} characters")
-        print()
+        print(f"   Parsed {summary['count']} recitals", file=out)
+        print(f"   Numbers: ({summary['first_number']}) to ({summary['last_number']})", file=out)
+        print(f"   Average length: {summary['average_length']} characters", file=out)
+        print(file=out)
 
         # Show first few recitals
-        print("   First 3 recitals:")
+        print("   First 3 recitals:", file=out)
         for i, (num, content) in enumerate(recitals[:3]):
-            print(f"   ({num}) {content[:100]}...")
-        print()
+            print(f"   ({num}) {content[:100]}...", file=out)
+        print(file=out)
 
         # Step 5: Generate XML
-        print("5. Generating Akoma Ntoso XML...")
-        recitals_xml = build_recitals_xml(recitals_text)
+        print("5. Generating Akoma Ntoso XML...", file=out)
+        recitals_xml = build_recitals_xml(recitals_text, recitals)
 
-        print(f"   Generated XML ({len(recitals_xml)} characters)")
-        print("   Sample XML structure:")
-        print("   " + "="*60)
+        print(f"   Generated XML ({len(recitals_xml)} characters)", file=out)
+        print("   Sample XML structure:", file=out)
+        print("   " + "="*60, file=out)
         # Show first 800 characters of XML
         xml_lines = recitals_xml.split('\n')[:20]
-        print('\n'.join(xml_lines))
-        print("   ...")
-        print("   " + "="*60)
-        print()
+        print('\n'.join(xml_lines), file=out)
+        print("   ...", file=out)
+        print("   " + "="*60, file=out)
+        print(file=out)
 
-        print("[OK] Recitals extraction test completed successfully!")
+        print("[OK] Recitals extraction test completed successfully!", file=out)
 
+        sys.stdout.write(out.getvalue())
         return recitals_location, recitals_text, recitals_xml
 
     except Exception as e:
-        print(f"   Error: {e}")
-        print("   Make sure OPENROUTER_API_KEY is set in .env file")
+        print(f"   Error: {e}", file=out)
+        print("   Make sure OPENROUTER_API_KEY is set in .env file", file=out)
+        sys.stdout.write(out.getvalue())
         return None, None, None
 
 if __name__ == "__main__":
-    test_recitals_extraction()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v", "-s"]))
\ No newline at end of file
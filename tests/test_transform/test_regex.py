@@ -0,0 +1,60 @@
+import sys
+import os
+import re
+import pytest
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.transform import paragraph_extractor
+from src.transform._regex import compile_pattern, _to_re2_syntax, _UNICODE_WHITESPACE, _UNICODE_DIGIT
+
+def test_to_re2_syntax_expands_escapes_outside_classes():
+    """Test \\s and \\d become Unicode classes outside a character class"""
+    assert _to_re2_syntax(r'^\d+\.\s+') == rf'^[{_UNICODE_DIGIT}]+\.[{_UNICODE_WHITESPACE}]+'
+    assert _to_re2_syntax(r'\S\D') == rf'[^{_UNICODE_WHITESPACE}][^{_UNICODE_DIGIT}]'
+
+def test_to_re2_syntax_splices_sets_inside_classes():
+    """Test escapes inside a character class expand to set contents, not a nested class"""
+    assert _to_re2_syntax(r'[^\s]') == rf'[^{_UNICODE_WHITESPACE}]'
+    assert _to_re2_syntax(r'[\d.]') == rf'[{_UNICODE_DIGIT}.]'
+    assert _to_re2_syntax(r'[]\s]') == rf'[]{_UNICODE_WHITESPACE}]'
+    assert _to_re2_syntax(r'[^\S]') is None
+
+def test_to_re2_syntax_leaves_escaped_backslashes():
+    """Test an escaped backslash followed by s or d is copied unchanged"""
+    assert _to_re2_syntax(r'\\s\\d') == r'\\s\\d'
+    assert _to_re2_syntax(r'[\\d]') == r'[\\d]'
+
+def test_to_re2_syntax_rejects_ascii_only_escapes():
+    """Test patterns using \\w or \\b are left to re"""
+    assert _to_re2_syntax(r'\w+') is None
+    assert _to_re2_syntax(r'\bArticle') is None
+
+def test_compile_pattern_uses_re2_like_re():
+    """Test patterns compile with RE2 (no silent fallback) and match the same text as re"""
+    re2 = pytest.importorskip("re2")
+
+    for name in ("_LETTERED_RE", "_ROMAN_RE", "_STRUCTURE_START_RE", "_PARAGRAPH_RE",
+                 "_AFTER_PARAGRAPH_RE", "_AFTER_SUB_PARAGRAPH_RE", "_SKIP_LINE_RE"):
+        assert isinstance(getattr(paragraph_extractor, name), re2._Regexp), f"{name} fell back to re"
+
+    patterns = [
+        r'^(?:(?P<number>\d+)\.|\((?P<paren_number>\d+)\))\s+(?P<text>.+)',
+        r'^\(([ivx]+)\)\s+(.+)',
+        r'\d+/\d+\s*$',
+        r'^[^\s]+\s*[\d.]+$',
+    ]
+    lines = [
+        "1. The following applies:", "(2) Member States", "(iv) nested", "7/29", "Page 7/29 ",
+        "\u0661\u0662. Arabic-Indic digits", "12.\u3000ideographic space", "(b)\u00a0no-break space",
+        "Article\u20033.1", "plain text",
+    ]
+    for pattern in patterns:
+        compiled = compile_pattern(pattern)
+        assert isinstance(compiled, re2._Regexp), pattern
+        reference = re.compile(pattern)
+        for line in lines:
+            expected = reference.search(line)
+            actual = compiled.search(line)
+            assert (actual is None) == (expected is None), (pattern, line)
+            if expected:
+                assert actual.group(0) == expected.group(0), (pattern, line)
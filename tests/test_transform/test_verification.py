@@ -0,0 +1,121 @@
+import sys
+import os
+import json
+import pytest
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.transform.models import ChapterInfo, SectionInfo
+from src.transform.verification import SectionVerifier
+from src.transform.verification.interval_index import ChapterIntervalIndex, OPEN_END_LINE
+from src.transform.verification_integration import VerificationIntegration, _write_json_stream
+
+def _sample_chapters():
+    """Chapters deliberately out of order to exercise sorting"""
+    return [
+        ChapterInfo(chapter_number="II", title="ICT risk management", start_line=1261, page_number=29, confidence=100),
+        ChapterInfo(chapter_number="I", title="General provisions", start_line=1005, page_number=23, confidence=95),
+        ChapterInfo(chapter_number="III", title="ICT-related incident management", start_line=1676, page_number=39, confidence=100),
+    ]
+
+def test_interval_index_bounds():
+    """Test chapter ranges run to the line before the next chapter starts"""
+    index = ChapterIntervalIndex(_sample_chapters())
+
+    assert len(index) == 3
+    assert index.bounds("I") == (1005, 1260)
+    assert index.bounds("II") == (1261, 1675)
+    assert index.bounds("III") == (1676, OPEN_END_LINE)
+
+def test_interval_index_unknown_chapter():
+    """Test chapters missing from the index get the open default range"""
+    assert ChapterIntervalIndex(_sample_chapters()).bounds("IX") == (0, OPEN_END_LINE)
+    assert ChapterIntervalIndex([]).bounds("I") == (0, OPEN_END_LINE)
+    assert ChapterIntervalIndex([]).bounds("I", (1, 2)) == (1, 2)
+
+def test_interval_index_duplicate_chapter_number():
+    """Test the later of two chapters sharing a number wins"""
+    chapters = _sample_chapters() + [
+        ChapterInfo(chapter_number="I", title="Repeated", start_line=2000, page_number=45, confidence=50)
+    ]
+    index = ChapterIntervalIndex(chapters)
+
+    assert index.bounds("I") == (2000, OPEN_END_LINE)
+    assert index.bounds("III") == (1676, 1999)
+
+def test_section_boundary_analysis():
+    """Test range checks and close-gap detection in the boundary analysis"""
+    sections = [
+        SectionInfo(section_number=number, parent_chapter="II", start_line=line, confidence=100)
+        for number, line in (("I", 1263), ("II", 1304), ("III", 1309), ("IV", 1000))
+    ]
+    analysis = _InMemorySectionVerifier({})._analyze_section_boundaries(sections, _sample_chapters())
+
+    assert [check["within_bounds"] for check in analysis["boundary_checks"]] == [True, True, True, False]
+    assert analysis["sections_outside_bounds"] == 1
+    assert [(issue["section1"], issue["section2"], issue["gap"]) for issue in analysis["overlap_issues"]] == [("II", "III", 5)]
+
+def test_write_json_stream_matches_json_dump(tmp_path):
+    """Test streamed report output is identical to an indented json dump"""
+    head = {"document": "DORA", "verification_summary": {"accuracy_percentage": 100.0, "issues": []}}
+    sections = [
+        {"section_number": "I", "parent_chapter": "II", "verification": {"issues": [], "confidence": 100.0}},
+        {"section_number": "II", "parent_chapter": "II", "title": "Gestion des risques liés aux TIC"},
+    ]
+
+    for items in (sections, []):
+        output_file = tmp_path / "report.json"
+        _write_json_stream(str(output_file), head, "sections", items)
+
+        expected = json.dumps({**head, "sections": items}, indent=2, ensure_ascii=False)
+        assert output_file.read_text(encoding="utf-8") == expected
+
+class _InMemorySectionVerifier(SectionVerifier):
+    """SectionVerifier reading lines from a dict instead of the PDF"""
+
+    def __init__(self, pdf_lines, **kwargs):
+        self._preloaded_lines = pdf_lines
+        super().__init__("in_memory.pdf", **kwargs)
+
+    def load_pdf_lines(self):
+        self.pdf_lines = dict(self._preloaded_lines)
+
+def test_section_verifier_fast_mode_skips_guaranteed_pass():
+    """Test fast mode stops once accuracy cannot drop below the threshold"""
+    sections = [
+        SectionInfo(section_number="I", parent_chapter="II", start_line=line, confidence=100)
+        for line in range(100)
+    ]
+    pdf_lines = {line: "Section I" for line in range(100)}
+
+    full_report = _InMemorySectionVerifier(pdf_lines).verify_all(sections)
+    fast_report = _InMemorySectionVerifier(pdf_lines, fast=True, fast_threshold=85).verify_all(sections)
+
+    assert full_report["summary"]["overall_accuracy"] == 100.0
+    assert "skipped_verifications" not in full_report["summary"]
+
+    # 90 of 100 verified guarantees at least 90% accuracy
+    statuses = [r["verification_status"] for r in fast_report["sections"]]
+    assert statuses == ["PASS"] * 90 + ["SKIPPED_HIGH_CONFIDENCE"] * 10
+    assert fast_report["summary"]["total_sections_verified"] == 90
+    assert fast_report["summary"]["skipped_verifications"] == 10
+    assert fast_report["summary"]["failed_verifications"] == 0
+    assert fast_report["summary"]["accuracy_lower_bound"] == 90.0
+
+    # Accuracy covers verified sections only, so an all-pass run still reports 100%
+    assert fast_report["summary"]["overall_accuracy"] == 100.0
+    assert fast_report["accuracy_metrics"]["total_items"] == 90
+
+def test_report_for_file_omits_details_when_all_pass():
+    """Test all-pass reports are written compactly unless full_report is set"""
+    report = {"summary": {"overall_accuracy": 100.0}, "sections": [{"section_number": "I"}, {"section_number": "II"}]}
+
+    compact = VerificationIntegration("in_memory.pdf", "TEST")._report_for_file(report, "sections", 100.0)
+    assert compact["sections"] == {"omitted": True, "reason": "all_sections_passed", "count": 2}
+    assert len(report["sections"]) == 2
+
+    full = VerificationIntegration("in_memory.pdf", "TEST", full_report=True)._report_for_file(report, "sections", 100.0)
+    assert full is report
+    assert VerificationIntegration("in_memory.pdf", "TEST")._report_for_file(report, "sections", 50.0) is report
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))